@@ -2,18 +2,32 @@ import os
 import re
 import sys
 import json
+import hashlib
+import importlib.util
+import inspect
+import logging
 import math
 import time
 import textwrap # For potential wrapping if needed
 import subprocess
+import threading
+import functools
+import concurrent.futures
+from contextlib import contextmanager, suppress
+from collections import OrderedDict, defaultdict
+import tempfile
 from pathlib import Path
 import tkinter as tk
 from tkinter import filedialog, simpledialog, messagebox
 import matplotlib
 matplotlib.use('TkAgg')  # This must come before pyplot import
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
+from matplotlib import artist as martist
+from matplotlib import colors as mcolors
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.transforms import Affine2D
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
-import networkx as nx
+import numpy as np
 import customtkinter as ctk
 try:
     from customtkinter import CTkToolTip # Try standard first
@@ -27,126 +41,483 @@ except ImportError:
         # sys.exit(1) 
         # For now, let the program continue without the tooltip if import fails
         CTkToolTip = None
-try:
-    import networkx.drawing.nx_agraph as nx_agraph
-    PYGRAPHVIZ_INSTALLED = True
-except ImportError:
-    PYGRAPHVIZ_INSTALLED = False
+# Optional and heavy dependencies are only located here (find_spec does not import
+# them); they are imported where first used, so startup does not pay for them.
+def _lazy_import(name):
+    """Returns module name, deferring its execution until the first attribute access."""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+# networkx is only needed once a project is loaded, and the first graph is built on
+# the load worker thread, so the window comes up without waiting for it
+nx = _lazy_import("networkx")
+PYGRAPHVIZ_INSTALLED = importlib.util.find_spec("pygraphviz") is not None
+if not PYGRAPHVIZ_INSTALLED:
     print("\n[Warning] pygraphviz not found. Graph layout will fallback to spring_layout.")
     print("          Install Graphviz system libraries and then run: pip install .[viz]\n")
 
-# Check for scipy availability (needed for spring_layout)
-SCIPY_INSTALLED = False
+# python-igraph is optional; its C force-directed layout is used for large graphs
+IGRAPH_INSTALLED = importlib.util.find_spec("igraph") is not None
+
+# orjson is optional; it parses large tach maps noticeably faster than the stdlib
 try:
-    import scipy
-    SCIPY_INSTALLED = True
+    import orjson
+    ORJSON_INSTALLED = True
 except ImportError:
+    ORJSON_INSTALLED = False
+
+# Check for scipy availability (needed for spring_layout and the hit-testing KD-tree)
+SCIPY_INSTALLED = importlib.util.find_spec("scipy") is not None
+if not SCIPY_INSTALLED:
     print("\n[ERROR] scipy not found but it is a required dependency.")
     print("        Please ensure the package was installed correctly: pip install dependency-visualizer\n")
     print("        The application will use fallback layout algorithms but optimal visualization requires scipy.\n")
 
+def parse_json(raw):
+    """Parses JSON given as bytes (tach map output, layout cache), skipping a UTF-8 BOM if present."""
+    if raw[:3] == b'\xef\xbb\xbf':
+        raw = raw[3:]
+    if ORJSON_INSTALLED:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+# --- Background Work ---
+BACKGROUND_POLL_MS = 50  # How often the Tk thread checks whether a background job finished
+
+# --- Layout ---
+LARGE_GRAPH_MIN_NODES = 500  # Above this, layouts switch to the O(n log n) / compiled algorithms
+BARNES_HUT_MIN_NODES = 2000  # Above this, energy_layout approximates far-away repulsion by cell centres of mass
+
+def spring_layout(graph, pos=None, k=None, iterations=50, seed=42):
+    """Force-directed layout of graph, returned as { node: (x, y) } scaled like nx.spring_layout.
+
+    For graphs above LARGE_GRAPH_MIN_NODES nodes this uses igraph's C implementation
+    of Fruchterman-Reingold when python-igraph is installed, and otherwise an L-BFGS
+    minimization of the FR energy (built into networkx >= 3.5, energy_layout before
+    that or above BARNES_HUT_MIN_NODES). Smaller graphs use nx.spring_layout.
+    pos seeds the initial positions in all cases and defaults to hde_layout;
+    k and iterations are ignored by the igraph path.
+    """
+    if pos is None:
+        pos = hde_layout(graph, seed=seed)
+    # networkx >= 3.5 minimizes the FR energy with L-BFGS for large graphs by itself (method='auto'),
+    # but with exact all-pairs repulsion; past BARNES_HUT_MIN_NODES the approximated backport is cheaper
+    nx_has_energy = "method" in inspect.signature(nx.spring_layout).parameters
+    n = graph.number_of_nodes()
+    if n <= LARGE_GRAPH_MIN_NODES or (not IGRAPH_INSTALLED and nx_has_energy and n <= BARNES_HUT_MIN_NODES):
+        return nx.spring_layout(graph, pos=pos, k=k, iterations=iterations, seed=seed)
+    if not IGRAPH_INSTALLED:
+        return energy_layout(graph, pos=pos, k=k, iterations=iterations, seed=seed)
+
+    import igraph
+
+    nodes = list(graph)
+    index = {node: i for i, node in enumerate(nodes)}
+    # Seed from pos where known, and from a seeded random layout otherwise (keeps runs reproducible)
+    initial = nx.random_layout(graph, seed=seed)
+    if pos:
+        initial.update((n, p) for n, p in pos.items() if n in index)
+    ig_graph = igraph.Graph(n=len(nodes), edges=[(index[u], index[v]) for u, v in graph.edges()], directed=True)
+    layout = ig_graph.layout_fruchterman_reingold(seed=[list(initial[n]) for n in nodes], niter=200)
+    coords = nx.rescale_layout(np.array(layout.coords, dtype=float))
+    return dict(zip(nodes, map(tuple, coords)))
+
+def hde_layout(graph, pivots=50, seed=42):
+    """High-dimensional embedding of graph, as { node: (x, y) } in the unit square, or None for tiny graphs.
+
+    Used as the starting point of the force-directed layouts: graph distances from up
+    to `pivots` nodes (picked farthest-first) are projected onto their two principal
+    components, so the layout starts untangled instead of from random positions.
+    Unreachable nodes count as one step further than the farthest reachable one.
+    """
+    import scipy as sp
+    import scipy.sparse.csgraph
+
+    nodes = list(graph)
+    n = len(nodes)
+    if n < 3:
+        return None
+    adjacency = nx.to_scipy_sparse_array(graph, nodelist=nodes, weight=None, format="csr")
+    rng = np.random.default_rng(seed)
+    distances = np.empty((n, min(pivots, n)))
+    closest = np.full(n, np.inf)
+    pivot = int(rng.integers(n))
+    for column in range(distances.shape[1]):
+        d = sp.sparse.csgraph.shortest_path(adjacency, directed=False, unweighted=True, indices=pivot)
+        reachable = np.isfinite(d)
+        d[~reachable] = d[reachable].max() + 1
+        distances[:, column] = d
+        closest = np.minimum(closest, d)
+        pivot = int(np.argmax(closest))
+    distances -= distances.mean(axis=0)
+    _, vectors = np.linalg.eigh(distances.T @ distances)
+    coords = distances @ vectors[:, -2:]
+    span = np.ptp(coords, axis=0)
+    if (span == 0).any():
+        return None
+    # Nodes with identical distance vectors would start on top of each other
+    coords = (coords - coords.min(axis=0)) / span + rng.normal(scale=1e-3, size=(n, 2))
+    return dict(zip(nodes, map(tuple, coords)))
+
+def energy_layout(graph, pos=None, k=None, iterations=50, seed=42, gravity=1.0):
+    """Fruchterman-Reingold layout found by minimizing the FR energy with scipy's L-BFGS-B.
+
+    Backport of the energy method networkx >= 3.5 uses for large graphs: edges attract
+    with energy d**3 / (3k), all node pairs repel with -k**2 * ln(d), and each connected
+    component is pulled towards the centre so components do not drift apart. Pairwise
+    terms are evaluated in row batches to bound memory; above BARNES_HUT_MIN_NODES
+    the repulsion comes from barnes_hut_repulsion instead of all pairs.
+    """
+    import scipy as sp
+    import scipy.optimize
+    import scipy.sparse.csgraph
+
+    nodes = list(graph)
+    n = len(nodes)
+    k = k or 1 / math.sqrt(n)
+    x0 = np.random.default_rng(seed).random((n, 2))
+    if pos:
+        index = {node: i for i, node in enumerate(nodes)}
+        for node, xy in pos.items():
+            if node in index:
+                x0[index[node]] = xy
+    adjacency = nx.to_scipy_sparse_array(graph, nodelist=nodes, weight=None, format="csr")
+    adjacency = (adjacency + adjacency.T) / 2
+    n_components, labels = sp.sparse.csgraph.connected_components(adjacency, directed=False)
+    component_sizes = np.bincount(labels)
+    batch = 500
+    rows, cols = adjacency.nonzero()
+    weights = np.asarray(adjacency[rows, cols]).ravel()
+
+    def energy(flat):
+        x = flat.reshape(n, 2)
+        grad = np.zeros_like(x)
+        value = 0.0
+        repulsion = barnes_hut_repulsion(x) if n > BARNES_HUT_MIN_NODES else None
+        if repulsion is not None:
+            # Attraction only needs the edges; repulsion is approximated
+            delta = x[rows] - x[cols]
+            dist2 = np.maximum((delta * delta).sum(axis=1), 1e-10)
+            np.add.at(grad, rows, (2 * np.sqrt(dist2) * weights / k)[:, None] * delta)
+            value += (weights * dist2 * np.sqrt(dist2)).sum() / (3 * k)
+            log_sum, inverse_sum = repulsion
+            grad -= 2 * k * k * inverse_sum
+            value -= k * k * log_sum
+        else:
+            for lo in range(0, n, batch):
+                hi = min(lo + batch, n)
+                delta = x[lo:hi, None, :] - x[None, :, :]
+                dist2 = np.maximum((delta * delta).sum(axis=2), 1e-10)
+                dist = np.sqrt(dist2)
+                attract = adjacency[lo:hi].multiply(dist).toarray()
+                grad[lo:hi] = 2 * np.einsum("ij,ijk->ik", attract / k - k * k / dist2, delta)
+                value += (attract * dist2).sum() / (3 * k) - k * k * np.log(dist).sum()
+        centers = np.zeros((n_components, 2))
+        np.add.at(centers, labels, x)
+        offset = centers / component_sizes[:, None] - 0.5
+        grad += gravity * offset[labels]
+        value += 0.5 * gravity * (component_sizes * (offset * offset).sum(axis=1)).sum()
+        return value, grad.ravel()
+
+    result = sp.optimize.minimize(energy, x0.ravel(), jac=True, method="L-BFGS-B",
+                                  options={"maxiter": iterations, "gtol": 1e-4})
+    coords = nx.rescale_layout(result.x.reshape(n, 2))
+    return dict(zip(nodes, map(tuple, coords)))
+
+def barnes_hut_repulsion(x):
+    """Approximates sum_j ln|x_i - x_j| and sum_j (x_i - x_j) / |x_i - x_j|**2 for every point i.
+
+    Returns (total of the log terms, (n, 2) array of the inverse-distance sums), or
+    None when the points are too bunched up for the approximation to pay off.
+    The points are binned into a quadtree of uniform grids. At each level a point
+    interacts with the centres of mass of the cells that are well separated from its
+    own cell (at least one cell apart) but whose parents are not, as in Barnes-Hut
+    with an opening angle of about one; only points in the neighbouring cells of the
+    finest grid are summed exactly. The cost is O(n log n) instead of O(n**2).
+    """
+    n = len(x)
+    lo = x.min(axis=0)
+    span = max(float((x.max(axis=0) - lo).max()), 1e-12) * (1 + 1e-9)
+    depth = max(2, math.ceil(math.log2(math.sqrt(n / 2))))
+    cells = np.minimum(((x - lo) / span * (1 << depth)).astype(np.int64), (1 << depth) - 1)
+
+    log_sum = 0.0
+    inverse_sum = np.zeros_like(x)
+    # The 6x6 children of the parent's 3x3 neighbourhood, relative to the parent's first child
+    children = np.array([(dx, dy) for dx in range(-2, 4) for dy in range(-2, 4)])
+    for level in range(2, depth + 1):
+        side = 1 << level
+        own = cells >> (depth - level)
+        cell_ids = own[:, 0] * side + own[:, 1]
+        mass = np.bincount(cell_ids, minlength=side * side).astype(float)
+        centre = np.column_stack([np.bincount(cell_ids, x[:, d], minlength=side * side) for d in (0, 1)])
+        centre /= np.maximum(mass, 1)[:, None]
+        candidates = (own >> 1 << 1)[:, None, :] + children[None, :, :]
+        separated = ((np.abs(candidates - own[:, None, :]).max(axis=2) > 1)
+                     & (candidates >= 0).all(axis=2) & (candidates < side).all(axis=2))
+        ids = np.where(separated, candidates[:, :, 0] * side + candidates[:, :, 1], 0)
+        weight = np.where(separated, mass[ids], 0.0)
+        delta = x[:, None, :] - centre[ids]
+        dist2 = np.maximum((delta * delta).sum(axis=2), 1e-10)
+        log_sum += 0.5 * (weight * np.log(dist2)).sum()
+        inverse_sum += np.einsum("ij,ijk->ik", weight / dist2, delta)
+
+    # Exact sums over the points in the 3x3 neighbourhood of each point's finest cell
+    side = 1 << depth
+    cell_ids = cells[:, 0] * side + cells[:, 1]
+    order = np.argsort(cell_ids, kind="stable")
+    starts = np.searchsorted(cell_ids[order], np.arange(side * side + 1))
+    sources, targets = [], []
+    for dx in (-1, 0, 1):
+        for dy in (-1, 0, 1):
+            neighbour = cells + (dx, dy)
+            valid = ((neighbour >= 0) & (neighbour < side)).all(axis=1)
+            ids = neighbour[valid, 0] * side + neighbour[valid, 1]
+            counts = starts[ids + 1] - starts[ids]
+            offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+            sources.append(np.repeat(np.flatnonzero(valid), counts))
+            targets.append(order[np.repeat(starts[ids], counts) + offsets])
+            if sum(map(len, sources)) > 64 * n:
+                return None
+    sources = np.concatenate(sources)
+    targets = np.concatenate(targets)
+    distinct = sources != targets
+    sources, targets = sources[distinct], targets[distinct]
+    delta = x[sources] - x[targets]
+    dist2 = np.maximum((delta * delta).sum(axis=1), 1e-10)
+    log_sum += 0.5 * np.log(dist2).sum()
+    np.add.at(inverse_sum, sources, delta / dist2[:, None])
+    return log_sum, inverse_sum
+
+# Initial layouts are cached on disk keyed by graph topology, so reloading an unchanged
+# project skips the force-directed layout entirely.
+LAYOUT_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "dependency_visualizer"
+LAYOUT_CACHE_MAX_FILES = 200  # Past this many cached layouts, the least recently written are removed
+
+def layout_cache_key(graph):
+    """Returns a hex digest identifying the graph's topology (sorted nodes and edges)."""
+    topology = repr(sorted(map(str, graph.nodes))) + repr(sorted((str(u), str(v)) for u, v in graph.edges))
+    return hashlib.blake2b(topology.encode(), digest_size=16).hexdigest()
+
+def load_cached_layout(key, graph):
+    """Returns the cached { node: (x, y) } for key, or None if missing, unreadable or stale."""
+    try:
+        with open(LAYOUT_CACHE_DIR / f"layout_{key}.json", "rb") as f:
+            cached = parse_json(f.read())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.keys() != set(graph.nodes):
+        return None
+    return {node: tuple(xy) for node, xy in cached.items()}
+
+def store_cached_layout(key, positions):
+    """Writes positions to the layout cache atomically; failures only cost the next load a relayout."""
+    try:
+        LAYOUT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=LAYOUT_CACHE_DIR, prefix="layout_", suffix=".tmp")
+    except OSError as e:
+        logger.debug("Could not write layout cache: %s", e)
+        return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({node: [float(x), float(y)] for node, (x, y) in positions.items()}, f)
+        os.replace(tmp_path, LAYOUT_CACHE_DIR / f"layout_{key}.json")
+    except Exception as e:
+        logger.debug("Could not write layout cache: %s", e)
+        with suppress(OSError):
+            os.remove(tmp_path) # Don't leave partial files behind in the cache dir
+        return
+    prune_layout_cache()
+
+def prune_layout_cache():
+    """Removes the oldest cached layouts (by modification time) past LAYOUT_CACHE_MAX_FILES."""
+    entries = []
+    for path in LAYOUT_CACHE_DIR.glob("layout_*.json"):
+        with suppress(OSError): # Another instance may be pruning at the same time
+            entries.append((path.stat().st_mtime, path))
+    if len(entries) <= LAYOUT_CACHE_MAX_FILES:
+        return
+    entries.sort()
+    for _, path in entries[:len(entries) - LAYOUT_CACHE_MAX_FILES]:
+        with suppress(OSError):
+            path.unlink()
+
+# --- Tach Configuration ---
+TACH_CONFIG_TEMPLATE = """# Auto-generated/Updated by Dependency Visualizer
+
+source_roots = [{source_root}]
+
+exclude = [
+{exclude_lines}
+]
+"""
+
+def render_tach_config(source_roots, exclude_patterns):
+    """Renders the tach.toml content for the given source roots and exclude patterns."""
+    # JSON string escaping (backslashes, quotes, control characters) is valid for TOML basic strings
+    exclude_lines = "\n".join(f"    {json.dumps(p, ensure_ascii=False)}," for p in exclude_patterns)
+    return TACH_CONFIG_TEMPLATE.format(source_root=json.dumps(source_roots[0], ensure_ascii=False), exclude_lines=exclude_lines)
+
+class LoadError(Exception):
+    """Raised when loading fails (tach produced no map, or no layout could be computed).
+
+    Carries the title and message of the error dialog, so the failure can be
+    reported on the Tk thread when the load ran on a worker thread.
+    """
+    def __init__(self, title, message):
+        super().__init__(message)
+        self.title = title
+
+@functools.lru_cache(maxsize=4096)  # Node ids repeat across explode/delete/undo index rebuilds
 def truncate_label(label, max_segments=4, join_char='.'):
     """Truncates a label like 'a.b.c.d' to 'a...c.d' if it has max_segments or more."""
-    parts = str(label).split(join_char)
-    if len(parts) >= max_segments:
-        # Keep first segment, add ellipsis, keep last two segments
-        return f"{parts[0]}{join_char}...{join_char}{join_char.join(parts[-2:])}"
+    label = str(label)
+    if label.count(join_char) + 1 >= max_segments:
+        # Keep first segment, add ellipsis, keep last two segments (sliced, no split list)
+        first_end = label.find(join_char)
+        last_two_start = label.rfind(join_char, 0, label.rfind(join_char)) + len(join_char)
+        return f"{label[:first_end]}{join_char}...{join_char}{label[last_two_start:]}"
     else:
-        return str(label)
+        return label
+
+logger = logging.getLogger(__name__)
+
+# --- Graph Colors ---
+DEFAULT_NODE_COLOR = '#1f78b4'  # Regular project packages
+EXTERNAL_NODE_COLOR = '#7f007f'  # External dependencies
+DEFAULT_EDGE_COLOR = 'black'
+HIGHLIGHT_DEP_COLOR = 'red'  # Dependencies of the selected node
+HIGHLIGHT_DEE_COLOR = 'blue'  # Dependents of the selected node
+SELECTED_NODE_COLOR = 'orange'
+
+# --- Level of Detail for Large Graphs ---
+LABEL_NODE_LIMIT = 300  # Above this many nodes, only the highlighted neighbourhood is labelled
+EDGE_LOD_NODE_LIMIT = 1000  # Above this many nodes, edges are drawn faint and without arrowheads
+EDGE_LOD_ALPHA = 0.3
+# Viewport culling: once zoomed in so the view covers less than this fraction of the
+# layout's area, edges and labels outside the view are left out of the draw
+VIEW_CULL_MAX_FRACTION = 0.7
+VIEW_CULL_MARGIN_PX = 100  # Slack around the view, so markers and arrowheads at its edge still show
+
+# Mouse wheel zoom: scale per wheel step, and how long the wheel must be idle before
+# the new view is rendered (ticks inside this window share a single redraw).
+SCROLL_ZOOM_FACTOR = 1.2
+SCROLL_REDRAW_DELAY_MS = 75
+
+# Hover hit-testing is memoized per square of this many pixels (LRU of HOVER_CACHE_SIZE squares)
+HOVER_BUCKET_PX = 4
+HOVER_CACHE_SIZE = 256
+HOVER_MIN_INTERVAL_MS = 16  # Motion events are handled at most ~60 times per second
+UNDO_TOOLTIP_DELAY_MS = 80  # The undo tooltip only shows if the pointer rests on the button this long
+
+# RGBA versions so color arrays can be assembled with NumPy instead of parsing strings per item
+DEFAULT_NODE_RGBA = np.array(mcolors.to_rgba(DEFAULT_NODE_COLOR))
+EXTERNAL_NODE_RGBA = np.array(mcolors.to_rgba(EXTERNAL_NODE_COLOR))
+HIGHLIGHT_DEP_RGBA = np.array(mcolors.to_rgba(HIGHLIGHT_DEP_COLOR))
+HIGHLIGHT_DEE_RGBA = np.array(mcolors.to_rgba(HIGHLIGHT_DEE_COLOR))
+SELECTED_NODE_RGBA = np.array(mcolors.to_rgba(SELECTED_NODE_COLOR))
+
+# --- Edge Arrowheads ---
+class ArrowheadCollection(PolyCollection):
+    """All edge arrowheads of a graph drawn as a single collection.
+
+    Edges themselves are drawn as one LineCollection; this adds the arrowheads on
+    top. Each triangle is anchored at its target node's center (in data coords)
+    and pulled back to the node's boundary. Node sizes are given in points, so
+    the triangles are recomputed in display space on every draw, which keeps them
+    attached to the nodes while zooming and panning.
+    """
+    def __init__(self, sources, targets, target_sizes, arrowsize=15, **kwargs):
+        self._arrowsize = arrowsize
+        super().__init__([], **kwargs)
+        # Triangles are in pixels relative to their offsets. An identity Affine2D rather
+        # than IdentityTransform, which the vector (SVG/PDF) renderers cannot translate
+        self.set_transform(Affine2D())
+        self.set_edges(sources, targets, target_sizes)
+
+    def set_edges(self, sources, targets, target_sizes):
+        """Sets the edge endpoints (data coords) and target node sizes (points^2)."""
+        self._sources = np.asarray(sources, dtype=float).reshape(-1, 2)
+        self._targets = np.asarray(targets, dtype=float).reshape(-1, 2)
+        self._target_radii = np.sqrt(np.asarray(target_sizes, dtype=float)) / 2.0 # Marker size is an area in points^2
+        self.set_offsets(self._targets)
+        self.stale = True
+
+    @martist.allow_rasterization
+    def draw(self, renderer):
+        if not self.get_visible() or self.axes is None or len(self._targets) == 0:
+            return
+        self.set_offset_transform(self.axes.transData)
+        src = self.axes.transData.transform(self._sources)
+        dst = self.axes.transData.transform(self._targets)
+        direction = dst - src
+        length = np.hypot(direction[:, 0], direction[:, 1])
+        length[length == 0] = 1.0
+        u = direction / length[:, None]
+        normal = np.column_stack([-u[:, 1], u[:, 0]])
+
+        # Same proportions as the '-|>' arrowstyle: head length 0.4, half width 0.2
+        px = renderer.points_to_pixels(1.0)
+        r = (self._target_radii * px)[:, None]
+        head_length = 0.4 * self._arrowsize * px
+        head_width = 0.2 * self._arrowsize * px
+        tip = -r * u
+        base = tip - head_length * u
+        verts = np.stack([tip, base + head_width * normal, base - head_width * normal], axis=1)
+        self.set_verts(verts)
+        super().draw(renderer)
+
 
 # --- Custom Toolbar ---
 class CustomNavigationToolbar(NavigationToolbar2Tk):
-    """Custom toolbar that ensures highlighting persists during pan/zoom."""
+    """Navigation toolbar that adds coalesced mouse wheel zoom."""
     def __init__(self, canvas, window, *, app, pack_toolbar=True):
         self.app = app
-        self.zooming = False  # Track zoom state
-        self.panning = False  # Track pan state
-        # Store view limits
-        self.view_limits = None
+        self._scroll_after_id = None # Pending coalesced redraw after wheel zoom
         super().__init__(canvas, window, pack_toolbar=pack_toolbar)
+        self.canvas.mpl_connect('scroll_event', self.scroll_event)
 
-    # --- Override specific action methods --- 
-
-    def pan(self, *args):
-        """Override pan action start/toggle."""
-        self.panning = not self.panning  # Toggle panning state
-        if self.panning:
-            self.view_limits = (self.app.ax.get_xlim(), self.app.ax.get_ylim())
-        super().pan(*args)
-
-    def zoom(self, *args):
-        """Override zoom action start/toggle."""
-        self.zooming = not self.zooming  # Toggle zooming state
-        if self.zooming:
-            self.view_limits = (self.app.ax.get_xlim(), self.app.ax.get_ylim())
-        super().zoom(*args)
-
-    def release_pan(self, event):
-        """Override pan action release (mouse button up)."""
-        current_xlim = self.app.ax.get_xlim()
-        current_ylim = self.app.ax.get_ylim()
-        
-        super().release_pan(event)
-        
-        if not self.panning:
-            current_positions = self.app.node_positions.copy() if self.app.node_positions else None
-            self.app.draw_graph(highlight_node=self.app.selected_node, preserve_view=True)
-            
-            if current_positions:
-                self.app.node_positions = current_positions
-            
-            self.app.ax.set_xlim(current_xlim)
-            self.app.ax.set_ylim(current_ylim)
-            self.canvas.draw()  # Force canvas update with restored limits
-
-    def release_zoom(self, event):
-        """Override zoom action release (mouse button up after drawing zoom box)."""
-        current_xlim = self.app.ax.get_xlim()
-        current_ylim = self.app.ax.get_ylim()
-        
-        super().release_zoom(event)
-        
-        new_xlim = self.app.ax.get_xlim()
-        new_ylim = self.app.ax.get_ylim()
-        
-        current_positions = self.app.node_positions.copy() if self.app.node_positions else None
-        self.app.draw_graph(highlight_node=self.app.selected_node, preserve_view=True)
-        
-        if current_positions:
-            self.app.node_positions = current_positions
-            
-        self.app.ax.set_xlim(new_xlim)
-        self.app.ax.set_ylim(new_ylim)
-        self.canvas.draw()  # Force canvas update with restored limits
+    # Pan and zoom need no overrides: the highlight overlay lives in data coordinates
+    # and the app's draw_event handler re-captures the clean background and blits the
+    # overlay after every full draw, so a view change only needs the draw the base
+    # class already schedules. The graph artists are not rebuilt and node positions
+    # are untouched.
+
+    # --- Mouse wheel zoom ---
+    # NavigationToolbar2 has no wheel handling of its own, so the toolbar hooks the
+    # canvas' scroll_event. Limits are applied on every tick (cheap), but the redraw is
+    # coalesced: each tick cancels the pending job and reschedules it, so a burst of
+    # trackpad events renders once after the wheel settles.
 
-    # Modify scroll_event override for mouse wheel zoom
     def scroll_event(self, event):
-        """Override scroll event to handle mouse wheel zoom with preserved view."""
-        current_xlim = self.app.ax.get_xlim()
-        current_ylim = self.app.ax.get_ylim()
-        
-        super().scroll_event(event)
-        
-        new_xlim = self.app.ax.get_xlim()
-        new_ylim = self.app.ax.get_ylim()
-        
-        self.canvas.get_tk_widget().after(
-            50, 
-            lambda: self._redraw_after_scroll(new_xlim, new_ylim, current_positions=self.app.node_positions.copy())
-        ) 
-
-    # Update helper method for delayed redraw
-    def _redraw_after_scroll(self, xlim, ylim, current_positions=None):
-        """Helper method to redraw the graph with highlights while preserving zoom state."""
-        self.app.draw_graph(highlight_node=self.app.selected_node, preserve_view=True)
-        
-        if current_positions:
-            self.app.node_positions = current_positions
-        
-        self.ax.set_xlim(xlim)
-        self.ax.set_ylim(ylim)
-        
-        self.canvas.draw()
+        """Zooms about the cursor on mouse wheel and schedules one coalesced redraw."""
+        ax = self.app.ax
+        if event.inaxes is not ax or event.xdata is None or event.ydata is None:
+            return
+        if self._scroll_after_id is None:
+            self.push_current() # One nav-stack entry per wheel burst, so Back/Home work
+        scale = SCROLL_ZOOM_FACTOR ** (-event.step)
+        x0, x1 = ax.get_xlim()
+        y0, y1 = ax.get_ylim()
+        ax.set_xlim(event.xdata - (event.xdata - x0) * scale, event.xdata + (x1 - event.xdata) * scale)
+        ax.set_ylim(event.ydata - (event.ydata - y0) * scale, event.ydata + (y1 - event.ydata) * scale)
+
+        widget = self.canvas.get_tk_widget()
+        if self._scroll_after_id is not None:
+            widget.after_cancel(self._scroll_after_id)
+        self._scroll_after_id = widget.after(SCROLL_REDRAW_DELAY_MS, self._redraw_after_scroll)
+
+    def _redraw_after_scroll(self):
+        """Renders the view once the wheel burst has settled."""
+        self._scroll_after_id = None
+        self.app._request_draw() # draw_idle of the new view; draw_event re-blits the highlight
 
 # --- Main App ---
 class DependencyVisualizerApp(ctk.CTk):
@@ -197,6 +568,11 @@ class DependencyVisualizerApp(ctk.CTk):
         self.exclude_label = ctk.CTkLabel(self.control_frame, text="Exclude Patterns (Glob, one per line):")
         self.exclude_label.grid(row=1, column=0, padx=(10,5), pady=(5,0), sticky="w")
 
+        # Indeterminate progress bar, shown next to the label while tach/layout run in the background
+        self.progress_bar = ctk.CTkProgressBar(self.control_frame, mode="indeterminate")
+        self.progress_bar.grid(row=1, column=1, columnspan=3, padx=(5,10), pady=(5,0), sticky="ew")
+        self.progress_bar.grid_remove() # Hidden until a background job starts
+
         self.exclude_textbox = ctk.CTkTextbox(self.control_frame, height=70)
         self.exclude_textbox.grid(row=2, column=0, columnspan=4, padx=10, pady=(0,10), sticky="ew")
 
@@ -226,8 +602,11 @@ class DependencyVisualizerApp(ctk.CTk):
         self.graph_frame.grid_columnconfigure(0, weight=1)
         self.graph_frame.grid_rowconfigure(0, weight=1) # Allow canvas to expand
 
-        # Setup matplotlib figure with proper configuration for zooming and panning
-        self.fig = plt.figure(figsize=(8, 6))
+        # Setup matplotlib figure with proper configuration for zooming and panning.
+        # The figure is a plain (Agg-rendered) Figure rather than a pyplot figure, so
+        # pyplot does not create its own hidden Tk window/canvas for it; the TkAgg
+        # canvas below is only used to display the Agg buffer and receive events.
+        self.fig = Figure(figsize=(8, 6))
         self.ax = self.fig.add_subplot(111)
         
         # Use tight layout instead of subplots_adjust
@@ -260,32 +639,86 @@ class DependencyVisualizerApp(ctk.CTk):
         # --- Tooltip Label for Undo Button ---
         self.undo_tooltip_label = ctk.CTkLabel(
             self.control_frame, 
-            text="", 
+            text="Undo (CTRL+Z)", 
             fg_color=("gray85", "gray17"),
             text_color=("black", "white"),
             corner_radius=4,
             padx=5, pady=2
         )
         # Initially hidden
+        self._undo_tooltip_after_id = None  # Pending delayed show of the undo tooltip
 
         # --- State Variables ---
         self.project_root = None
         self.tach_data = None
+        self._file_node_keys = {}  # { tach file path: _resolve_filepath() result }, per load
+        self._dir_listings = {}  # { project-relative dir: frozenset of entry names }, per load
         self.graph = None  # NetworkX graph
         self.node_positions = None  # Layout positions
         self.selected_node = None  # Current selected node
         self.hovered_node = None  # Currently hovered node
         self.history = []  # Save states for undo
+        self._tach_map = None  # Long-lived tach DependentMap (in-process tach API)
+        self._tach_map_key = None  # (project root, tach.toml content) the map was built for
+        self._tach_map_output = None  # Temp file the in-process map is written to
+        self._tach_config_root = None  # Project root the source roots below were detected for
+        self._tach_source_roots = (".",)  # Source roots of the selected project
+        self._tach_config_cache = None  # ((source roots, excludes), rendered tach.toml content)
+
+        # --- Background Work (tach + layout run off the Tk thread) ---
+        # At most one job runs at a time (see _busy); tach's map object is not meant for concurrent use
+        self._busy = False  # True while a background job runs; graph-modifying actions are ignored
+        self._background_poll_id = None  # after() id of the pending poll for the running job
+
+        # --- Rendering State (for blitted highlight updates) ---
+        self._bg = None  # Cached canvas background without the highlight overlay
+        self._node_coll = None  # PathCollection of all nodes
+        self._edge_lines = None  # LineCollection of all edges, in graph edge order
+        self._edge_heads = None  # ArrowheadCollection of all edges, in graph edge order
+        self._label_artists = {}  # { node: Text }
+        self._node_sizes = np.empty(0)  # Marker size per node, aligned with self._node_order
+        self._highlight_artists = []  # Animated overlay artists for the current highlight
+        self._highlight_labels = []  # Label artists redrawn on top of the overlay
+
+        # --- Per-graph Index Caches (rebuilt by _rebuild_index_caches) ---
+        self._node_order = []  # Nodes in graph order
+        self._node_index = {}  # { node: position in _node_order }
+        self._base_node_rgba = np.empty((0, 4))  # (N, 4) default node colors
+        self._truncated_labels = {}  # { node: truncated label }, per graph
+        self._edge_list = []  # Edges in graph order
+        self._edge_src = np.empty(0, dtype=np.int32)  # Source node index per edge
+        self._edge_dst = np.empty(0, dtype=np.int32)  # Target node index per edge
+        self._edge_segments = np.empty((0, 2, 2))  # (E, 2, 2) edge endpoints of the drawn layout
+        self._node_xy = np.empty((0, 2))  # (N, 2) node positions of the drawn layout
+        self._edge_keep = None  # Mask of the edges left after viewport culling, None when all are drawn
+        self._out_edge_idx = {}  # { node: int32 array of its out-edge indices }
+        self._in_edge_idx = {}  # { node: int32 array of its in-edge indices }
+
+        # --- Hit-testing Index (display coordinates, rebuilt lazily after each draw) ---
+        self._kdtree = None  # cKDTree over node display coordinates
+        self._kdtree_nodes = []  # Node for each point in the tree
+        self._hover_cache = OrderedDict()  # LRU { (x, y) pixel bucket: node or None }, per spatial index
+        self._last_hover_time = 0.0  # time.monotonic() of the last handled motion event
+        self._pending_hover_event = None  # Latest motion event held back by the rate limit
+        self._hover_after_id = None  # after() job that handles _pending_hover_event
+        self._disp_pts = None  # (N, 2) node display coordinates
+
+        # --- Draw Batching (see _hold_draw) ---
+        self._draw_held = False  # True inside a _hold_draw() block
+        self._pending_draw = None  # None, 'blit' or 'full' while held
 
         # --- Matplotlib Event Bindings ---
         # Use only standard matplotlib events
         self.canvas.mpl_connect('button_press_event', self.on_click)
         self.canvas.mpl_connect('motion_notify_event', self.on_hover)
+        self.canvas.mpl_connect('draw_event', self._on_draw_event)
+        self.canvas.mpl_connect('resize_event', self._on_resize)
         
         # Variables to help detect double clicks manually
         self._last_click_time = 0
         self._last_click_event = None
         self._double_click_threshold = 0.3  # seconds
+        self._pending_single_click = None  # after() id of a single-click action waiting out the threshold
         
         # Bind keyboard shortcuts
         self.bind('<Control-z>', self.undo_last_action)
@@ -311,18 +744,29 @@ class DependencyVisualizerApp(ctk.CTk):
 
         print(f"Searching for packages (__init__.py) in: {root_dir_abs}")
 
-        for dirpath, dirnames, filenames in os.walk(root_dir_abs, topdown=True):
-            # Exclude common virtual environment folders and hidden folders
-            # Modify this list as needed
-            dirnames[:] = [d for d in dirnames if not d.startswith('.') and d not in ('venv', '.venv', 'env', '.env', '__pycache__')]
+        # Exclude common virtual environment folders and hidden folders
+        # Modify this list as needed
+        excluded_dirs = {'venv', 'env', '__pycache__'}
+        prefix_len = len(os.path.join(root_dir_abs, ''))
 
-            if "__init__.py" in filenames:
-                # Check if it's the root directory itself
-                if os.path.abspath(dirpath) != root_dir_abs:
-                    relative_path = os.path.relpath(dirpath, root_dir_abs)
+        # One scandir per directory: entry types come with the listing, so
+        # subdirectories and __init__.py are found without extra stat calls
+        pending = [root_dir_abs]
+        while pending:
+            dirpath = pending.pop()
+            try:
+                with os.scandir(dirpath) as entries:
+                    entries = list(entries)
+            except OSError:
+                continue
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if not entry.name.startswith('.') and entry.name not in excluded_dirs:
+                        pending.append(entry.path)
+                elif entry.name == "__init__.py" and dirpath != root_dir_abs:
                     # Normalize path separators for consistency
-                    package_dirs.append(relative_path.replace('\\', '/'))
-                    print(f"  Found package: {relative_path}")
+                    package_dirs.append(dirpath[prefix_len:].replace('\\', '/'))
+                    logger.debug("Found package: %s", package_dirs[-1])
 
         # Sort for consistent output
         package_dirs.sort()
@@ -338,40 +782,16 @@ class DependencyVisualizerApp(ctk.CTk):
             self.path_entry.delete(0, ctk.END)
             self.path_entry.insert(0, self.project_root)
             self.load_button.configure(state="normal")
-            print(f"Selected project root: {self.project_root}")
+            logger.debug("Selected project root: %s", self.project_root)
+            self._prepare_tach_config()
             # Optionally, find packages immediately after selection
             # self.found_packages = self.find_python_packages(self.project_root)
             # print(f"Potential packages found: {self.found_packages}")
         else:
             self.load_button.configure(state="disabled")
 
-    def run_tach(self):
-        """Checks for tach.toml, creates/updates it with UI excludes,
-           runs tach map, and returns the parsed JSON output."""
-        if not self.project_root:
-            messagebox.showerror("Error", "No project root selected.")
-            return None
-
-        tach_config_path = os.path.join(self.project_root, "tach.toml")
-
-        # --- 1. Get Exclude Patterns from UI --- 
-        exclude_text = self.exclude_textbox.get("1.0", "end-1c")
-        user_exclude_patterns = [line.strip() for line in exclude_text.splitlines() if line.strip()]
-        
-        # Format for TOML array - Avoid backslash in f-string expression for < Py3.12
-        exclude_toml_lines = []
-        for p in user_exclude_patterns:
-            # Escape backslashes if needed for TOML strings
-            escaped_p = p.replace('\\', '\\\\') 
-            exclude_toml_lines.append(f'    "{escaped_p}",')
-        exclude_toml_list_str = "\n".join(exclude_toml_lines)
-        
-        print(f"Using exclude patterns from UI: {user_exclude_patterns}")
-
-        # --- 2. Check for/Create or Update Tach Configuration ---
-        # Always write/overwrite tach.toml to ensure current excludes are used
-        # print(f"Writing/Updating {tach_config_path} with current exclude patterns.")
-        
+    def _prepare_tach_config(self):
+        """Detects the source roots of the selected project root, once per selection."""
         # Initialize source_roots list
         source_roots = ["."] # Always include the project root
 
@@ -380,34 +800,73 @@ class DependencyVisualizerApp(ctk.CTk):
         if os.path.isdir(src_dir_path):
              source_roots.append("src")
 
-        config = {
-            "modules": [], # Start with empty modules list; we'll define source roots
-            "source_roots": source_roots, # Use the determined source roots
-            "force_package_roots": ["."] # Treat project root as package regardless of __init__.py
-        }
+        self._tach_source_roots = tuple(source_roots)
+        self._tach_config_root = self.project_root
+        self._tach_config_cache = None
 
-        # Add excludes if any exist
-        if user_exclude_patterns: # Use the local variable read from the UI
-             config["exclude"] = user_exclude_patterns # Use the local variable
+    def _prepare_tach_run(self):
+        """Reads the exclude patterns from the UI and renders the tach.toml content.
 
-        # Generate config content using UI exclude patterns
-        config_content = f"""# Auto-generated/Updated by Dependency Visualizer
+        Touches Tk widgets, so it must run on the main thread. Returns None if no
+        project root is selected.
+        """
+        if not self.project_root:
+            messagebox.showerror("Error", "No project root selected.")
+            return None
 
-source_roots = ["{source_roots[0]}"]
+        # --- 1. Get Exclude Patterns from UI --- 
+        exclude_text = self.exclude_textbox.get("1.0", "end-1c")
+        user_exclude_patterns = tuple(line.strip() for line in exclude_text.splitlines() if line.strip())
+        
+        print(f"Using exclude patterns from UI: {list(user_exclude_patterns)}")
 
-exclude = [
-{exclude_toml_list_str}
-]
-"""
-        print("--- Generated/Updated tach.toml Content ---")
-        print(config_content)
-        print("-----------------------------------------")
-        # Write the config file (overwrite if exists)
-        with open(tach_config_path, "w", encoding="utf-8") as f:
-            f.write(config_content)
-        print(f"  Successfully wrote {tach_config_path}")
-
-        # --- 3. Run Tach from the selected project root dir ---
+        # --- 2. Check for/Create or Update Tach Configuration ---
+        # Always write/overwrite tach.toml to ensure current excludes are used.
+        # The content only depends on the root and the excludes, so it is rendered
+        # once and reused on repeat loads.
+        if self._tach_config_root != self.project_root:
+            self._prepare_tach_config()
+        cache_key = (self._tach_source_roots, user_exclude_patterns)
+        if self._tach_config_cache is None or self._tach_config_cache[0] != cache_key:
+            self._tach_config_cache = (cache_key, render_tach_config(self._tach_source_roots, user_exclude_patterns))
+        config_content = self._tach_config_cache[1]
+        logger.debug("Generated/Updated tach.toml content:\n%s", config_content)
+        return config_content
+
+    def _compute_tach_map(self, config_content):
+        """Writes tach.toml and builds the tach map; returns the parsed JSON output.
+
+        Does not touch Tk, so it can run on a worker thread. Failures are raised
+        as LoadError carrying the title and message to show to the user.
+        """
+        tach_config_path = os.path.join(self.project_root, "tach.toml")
+        # Write the config file, unless it already has exactly this content (e.g. a
+        # refresh with unchanged excludes). The file is compared rather than a
+        # remembered hash, so edits made outside the app are still overwritten.
+        new_bytes = config_content.encode("utf-8")
+        try:
+            with open(tach_config_path, "rb") as f:
+                unchanged = f.read() == new_bytes
+        except OSError:
+            unchanged = False
+        if not unchanged:
+            with open(tach_config_path, "wb") as f:
+                f.write(new_bytes)
+            print(f"  Successfully wrote {tach_config_path}")
+
+        # --- 3. Build the map in-process if tach's Python API is available ---
+        # This avoids paying interpreter + tach import startup on every load.
+        try:
+            tach_data = self._run_tach_in_process(config_content)
+        except Exception as e:
+            print(f"In-process tach map failed ({e}). Falling back to the tach CLI.")
+            self._tach_map = None
+            tach_data = None
+        if tach_data is not None:
+            self.tach_project_root = self.project_root
+            return tach_data
+
+        # --- 4. Otherwise run Tach from the selected project root dir ---
         command = [sys.executable, "-m", "tach", "map"]
         print(f"Running command: {' '.join(command)} in {self.project_root}") # Use self.project_root for cwd
 
@@ -416,69 +875,106 @@ exclude = [
                 command,
                 cwd=self.project_root, # Run from the selected dir
                 capture_output=True,
-                text=True,
-                check=True,
-                encoding='utf-8'
+                check=True
             )
-            print("Tach output received.")
-            output = result.stdout
-            print("--- Raw Tach Map Output ---")
-            print(output)
-            print("---------------------------")
-            if output.startswith('﻿'):
-                output = output.lstrip('﻿')
+            # Keep stdout as bytes; the JSON parser decodes it directly
+            print(f"Tach output received ({len(result.stdout)} bytes).")
             # Store the root used by tach (which is self.project_root here)
             self.tach_project_root = self.project_root # Set tach_project_root
-            return json.loads(output)
+            return parse_json(result.stdout)
 
-        except FileNotFoundError:
-            messagebox.showerror("Error", f"Could not find '{sys.executable} -m tach'. Is tach installed?")
-            return None
+        except FileNotFoundError as e:
+            raise LoadError("Error", f"Could not find '{sys.executable} -m tach'. Is tach installed?") from e
         except subprocess.CalledProcessError as e:
              # Error should now be more indicative of a real config/project issue
-             messagebox.showerror(
+             print(f"Tach stderr:\n{e.stderr.decode('utf-8', 'replace')}")
+             print(f"Tach stdout:\n{e.stdout.decode('utf-8', 'replace')}")
+             raise LoadError(
                 "Tach Error",
                 f"""Tach failed with exit code {e.returncode}. Check your tach.toml configuration and project structure (e.g., syntax errors, missing __init__.py).
 
 Stderr:
-{e.stderr}"""
-            )
-             print(f"Tach stderr:\n{e.stderr}")
-             print(f"Tach stdout:\n{e.stdout}")
-             return None
+{e.stderr.decode('utf-8', 'replace')}"""
+            ) from e
         except json.JSONDecodeError as e:
-              messagebox.showerror(
+              print(f"Failed to parse Tach JSON output: {e}")
+              print(f"Raw Tach output:\n{result.stdout.decode('utf-8', 'replace')}")
+              raise LoadError(
                  "JSON Error",
                  f"""Failed to parse Tach output (from tach map) as JSON:
 {e}
 
 Raw output:
-{result.stdout[:500]}..."""
-             )
-              print(f"Failed to parse Tach JSON output: {e}")
-              print(f"Raw Tach output:\n{result.stdout}")
-              return None
+{result.stdout[:500].decode('utf-8', 'replace')}..."""
+             ) from e
         except Exception as e:
-             messagebox.showerror("Error", f"An unexpected error occurred: {e}")
              print(f"Unexpected error running tach: {e}")
-             return None
+             raise LoadError("Error", f"An unexpected error occurred: {e}") from e
+
+    def _run_tach_in_process(self, config_content):
+        """Builds the tach dependency map with tach's Python API instead of a subprocess.
+
+        The DependentMap is kept across loads and only rebuilt (re-scanning sources)
+        while the project root and tach.toml content stay the same.
+
+        Returns:
+            The parsed map ({ source_file: [target_files] }), or None if this tach
+            version does not expose the API.
+        """
+        try:
+            from tach.extension import DependentMap, Direction, ProjectConfig
+            from tach.parsing import parse_project_config
+        except ImportError:
+            return None
+
+        key = (os.path.abspath(self.project_root), config_content)
+        if self._tach_map is not None and self._tach_map_key == key:
+            self._tach_map.rebuild()
+        else:
+            root = Path(self.project_root).resolve()
+            project_config = parse_project_config(root) or ProjectConfig()
+            self._tach_map = DependentMap(root, project_config, Direction.Dependencies)
+            self._tach_map_key = key
+
+        if self._tach_map_output is None:
+            fd, self._tach_map_output = tempfile.mkstemp(prefix="depviz_tach_", suffix=".json")
+            os.close(fd)
+        self._tach_map.write_to_file(Path(self._tach_map_output))
+        with open(self._tach_map_output, 'rb') as f:
+            return parse_json(f.read())
+
+    def _project_path_exists(self, normalized_path):
+        """Returns whether a path relative to the tach project root exists.
+
+        Answered from directory listings cached per load: one scandir per directory
+        replaces a stat per referenced file, for both the graph build and explode.
+        """
+        directory, name = os.path.split(normalized_path)
+        names = self._dir_listings.get(directory)
+        if names is None:
+            try:
+                with os.scandir(os.path.join(self.tach_project_root, directory)) as entries:
+                    names = frozenset(entry.name for entry in entries)
+            except OSError:
+                names = frozenset()
+            self._dir_listings[directory] = names
+        return name in names
 
     def build_graph_from_tach(self, tach_data):
         """Builds a networkx graph of *packages* from the parsed tach map JSON data."""
         # Input format is expected: { "source_file": ["target_file1", ...], ... }
+        # Runs on the worker thread, so failures are raised for the Tk thread to show
         if not isinstance(tach_data, dict):
-            messagebox.showerror("Error", "Invalid tach map data received (expected dict)." + f"\nGot: {type(tach_data)}")
-            return None
+            raise LoadError("Error", "Invalid tach map data received (expected dict)." + f"\nGot: {type(tach_data)}")
 
         print(f"Building package graph from tach map data with {len(tach_data)} entries.")
         G = nx.DiGraph()
-        package_dependencies = {} # Store { source_pkg: set(target_pkgs) }
+        package_dependencies = defaultdict(set) # Store { source_pkg: set(target_pkgs) }
         
-        # Track different types of packages
-        project_packages = set()  # Internal project packages
-        external_packages = set() # External dependencies
         top_level_packages = set()  # Store top-level packages only
 
+        # The same files appear in many entries of the tach map; resolve each once
+        @functools.lru_cache(maxsize=None)
         def get_package_from_filepath(filepath):
             """Converts a file path relative to source root to a package name."""
             
@@ -486,7 +982,7 @@ Raw output:
             normalized_path = filepath.replace('\\', '/')
             
             # Handle external/standard library imports by checking if the path exists
-            if not os.path.exists(os.path.join(self.project_root, normalized_path)):
+            if not self._project_path_exists(normalized_path):
                 # This is likely an external dependency
                 # Just extract the first part of the path to represent the external package
                 parts = normalized_path.split('/')
@@ -529,90 +1025,43 @@ Raw output:
                 return parts[0]
             return package_name
 
-        all_packages = set()
-        # First pass: collect all packages and their dependencies
-        detailed_package_dependencies = {}  # Full dependency details before collapsing
-        
+        # Files resolve straight to their top-level package, so dependencies are
+        # aggregated at top level in the same pass that reads the tach map
+        @functools.lru_cache(maxsize=None)
+        def get_top_level_package_of_file(filepath):
+            package = get_package_from_filepath(filepath)
+            return get_top_level_package(package) if package else None
+
         for source_file, target_files in tach_data.items():
-            source_pkg = get_package_from_filepath(source_file)
-            if not source_pkg:
-                print(f"Warning: Could not determine package for source file '{source_file}'")
+            top_source = get_top_level_package_of_file(source_file)
+            if not top_source:
+                logger.warning("Could not determine package for source file '%s'", source_file)
                 continue
 
-            # Check if this is an external package
-            if source_pkg.startswith("ext:"):
-                external_packages.add(source_pkg)
-            else:
-                project_packages.add(source_pkg)
-                
-            all_packages.add(source_pkg)
-            if source_pkg not in detailed_package_dependencies:
-                detailed_package_dependencies[source_pkg] = set()
+            top_level_packages.add(top_source)
+            targets = package_dependencies[top_source]
 
             for target_file in target_files:
-                target_pkg = get_package_from_filepath(target_file)
-                if target_pkg:
-                    # Check if this is an external package
-                    if target_pkg.startswith("ext:"):
-                        external_packages.add(target_pkg)
-                    else:
-                        project_packages.add(target_pkg)
-                        
-                    all_packages.add(target_pkg)
-                    # Add dependency if it's a different package
-                    if source_pkg != target_pkg:
-                        detailed_package_dependencies[source_pkg].add(target_pkg)
+                top_target = get_top_level_package_of_file(target_file)
+                if top_target:
+                    top_level_packages.add(top_target)
+                    # Only add dependency if top-level packages are different
+                    if top_source != top_target:
+                        targets.add(top_target)
                 else:
-                     print(f"Warning: Could not determine package for target file '{target_file}'")
-
-        # Second pass: collapse sub-packages to top-level packages
-        for pkg in all_packages:
-            top_pkg = get_top_level_package(pkg)
-            top_level_packages.add(top_pkg)
-            
-            # Add to package_dependencies if not already there
-            if top_pkg not in package_dependencies:
-                package_dependencies[top_pkg] = set()
-                
-        # Aggregate dependencies at top level
-        for source_pkg, targets in detailed_package_dependencies.items():
-            top_source = get_top_level_package(source_pkg)
-            
-            for target_pkg in targets:
-                top_target = get_top_level_package(target_pkg)
-                
-                # Only add dependency if top-level packages are different
-                if top_source != top_target:
-                    package_dependencies[top_source].add(top_target)
+                     logger.warning("Could not determine package for target file '%s'", target_file)
         
         print(f"Collapsed to {len(top_level_packages)} top-level packages: {sorted(list(top_level_packages))}")
 
-        # Add nodes for all top-level packages
-        for pkg_name in top_level_packages:
-            # Add node attributes for visualization based on package type
-            if pkg_name.startswith("ext:"):
-                # External package - use different attributes
-                G.add_node(pkg_name, is_external=True)
-            else:
-                # Internal project package
-                G.add_node(pkg_name, is_external=False)
-                
-        #print(f"Added {len(top_level_packages)} package nodes")
-        #external_top_pkgs = [p for p in top_level_packages if p.startswith("ext:")]
-        #print(f"External packages: {sorted(external_top_pkgs)}")
-
-        # Add edges based on the aggregated top-level package dependencies
-        edge_count = 0
-        for source_pkg, target_pkgs in package_dependencies.items():
-            if G.has_node(source_pkg):
-                 for target_pkg in target_pkgs:
-                      if G.has_node(target_pkg):
-                           G.add_edge(source_pkg, target_pkg)
-                           edge_count += 1
-                      else:
-                           print(f"Warning: Skipping edge to missing target package node '{target_pkg}'")
-            else:
-                 print(f"Warning: Skipping edges from missing source package node '{source_pkg}'")
+        # Add nodes for all top-level packages, marking external ones for visualization
+        G.add_nodes_from((pkg_name, {'is_external': pkg_name.startswith("ext:")}) for pkg_name in top_level_packages)
+
+        # Add edges based on the aggregated top-level package dependencies. Every
+        # endpoint is the top-level package of a collected package, so it is a node.
+        G.add_edges_from(
+            (source_pkg, target_pkg) for source_pkg, target_pkgs in package_dependencies.items() for target_pkg in target_pkgs
+        )
+        edge_count = G.number_of_edges()
 
         print(f"Package graph built with {G.number_of_nodes()} nodes and {edge_count} edges.")
         # Check for nodes with no connections (might indicate issues or be leaves/roots)
@@ -622,145 +1071,365 @@ Raw output:
 
         return G
 
+    def _rebuild_index_caches(self):
+        """Rebuilds the per-graph node index and default color array.
+
+        Must be called whenever self.graph is replaced or mutated.
+        """
+        self._node_order = list(self.graph.nodes()) if self.graph else []
+        self._node_index = {node: i for i, node in enumerate(self._node_order)}
+        is_external = np.fromiter(
+            (self.graph.nodes[n].get('is_external', False) for n in self._node_order),
+            dtype=bool, count=len(self._node_order)
+        )
+        self._base_node_rgba = np.where(is_external[:, None], EXTERNAL_NODE_RGBA, DEFAULT_NODE_RGBA)
+        # Truncated labels only change with the node set, not per draw
+        self._truncated_labels = {node: truncate_label(node, max_segments=4) for node in self._node_order}
+        # Marker sizes grow with the label length, so they too are fixed per node set
+        base_size = 1000
+        size_per_char = 100
+        min_size = 1000
+        max_size = 10000
+        label_lens = np.fromiter(
+            (len(self._truncated_labels[n]) for n in self._node_order), dtype=float, count=len(self._node_order)
+        )
+        self._node_sizes = np.clip(base_size + size_per_char * label_lens, min_size, max_size)
+
+        # Edge index arrays, so highlighting can pick a node's edges and neighbours
+        # by fancy-indexing instead of walking the adjacency each click
+        self._edge_list = list(self.graph.edges()) if self.graph else []
+        out_idx = defaultdict(list)
+        in_idx = defaultdict(list)
+        for i, (u, v) in enumerate(self._edge_list):
+            out_idx[u].append(i)
+            in_idx[v].append(i)
+        self._out_edge_idx = {n: np.array(ix, dtype=np.int32) for n, ix in out_idx.items()}
+        self._in_edge_idx = {n: np.array(ix, dtype=np.int32) for n, ix in in_idx.items()}
+        self._edge_src = np.array([self._node_index[u] for u, _ in self._edge_list], dtype=np.int32)
+        self._edge_dst = np.array([self._node_index[v] for _, v in self._edge_list], dtype=np.int32)
+        if not self.graph:
+            # The old plot stays up (and can still be panned) while a new graph loads;
+            # drop its culling state so _cull_to_view has nothing to index
+            self._edge_segments = np.empty((0, 2, 2))
+            self._node_xy = np.empty((0, 2))
+            self._edge_keep = None
+
     def draw_graph(self, highlight_node=None, preserve_view=False):
         """Draws the current graph state on the matplotlib canvas with customizations."""
-        try:
-            if not self.graph: return 
-            
-            # Store current view limits if preserving view
-            if preserve_view:
-                current_xlim = self.ax.get_xlim()
-                current_ylim = self.ax.get_ylim()
-                
-            # Setup the plot appearance
-            dark_gray = '#505050'
-            self.ax.clear()
-            self.ax.set_facecolor(dark_gray)
-            self.fig.set_facecolor(dark_gray)
-            plt.axis('off')
-            
-            # Calculate layout if needed (avoid recalculating if preserving view)
-            if self.node_positions is None or not preserve_view:
-                try:
-                    # Try pygraphviz first if installed
-                    if PYGRAPHVIZ_INSTALLED:
-                        self.node_positions = nx_agraph.graphviz_layout(self.graph, prog='dot')
+        if not self.graph: return 
+        
+        # The base artists are kept across redraws and updated in place below;
+        # they are only (re)created on first use or after the axes were cleared
+        if self._node_coll is None or self._node_coll.axes is None:
+            self._create_base_artists()
+
+        # Calculate layout only if there is none yet; load/explode/undo keep
+        # self.node_positions up to date incrementally
+        if self.node_positions is None or any(n not in self.node_positions for n in self.graph):
+            try:
+                # Try pygraphviz first if installed
+                if PYGRAPHVIZ_INSTALLED:
+                    prog = 'sfdp' if self.graph.number_of_nodes() > LARGE_GRAPH_MIN_NODES else 'dot'
+                    self.node_positions = nx.nx_agraph.graphviz_layout(self.graph, prog=prog)
+                else:
+                    # Fall back to spring_layout with scipy
+                    if SCIPY_INSTALLED:
+                        # Safely try to use spring_layout which depends on scipy
+                        self.node_positions = spring_layout(self.graph, seed=42)
                     else:
-                        # Fall back to spring_layout with scipy
-                        if SCIPY_INSTALLED:
-                            # Safely try to use spring_layout which depends on scipy
-                            self.node_positions = nx.spring_layout(self.graph, seed=42)
-                        else:
-                            # Simple fallback if scipy is not available - use circular layout
-                            print("Using circular_layout as fallback due to missing scipy dependency")
-                            self.node_positions = nx.circular_layout(self.graph)
-                        
-                except Exception as e: 
-                    print(f"Failed to calculate initial layout: {e}")
-                    try:
-                        # Last resort - use shell layout or circular layout which don't need scipy
-                        print("Attempting circular_layout as last resort")
+                        # Simple fallback if scipy is not available - use circular layout
+                        logger.warning("Using circular_layout as fallback due to missing scipy dependency")
                         self.node_positions = nx.circular_layout(self.graph)
-                    except Exception as e2:
-                        messagebox.showerror("Layout Error", f"Failed to calculate any layout: {e2}")
-                        return
                     
-            # Prepare node labels and sizes
-            truncated_labels = {node: truncate_label(node, max_segments=4) for node in self.graph.nodes()}
-            node_sizes = []
-            base_size = 1000
-            size_per_char = 100
-            min_size = 1000
-            max_size = 10000
-            
-            if self.graph.number_of_nodes() > 0:
+            except Exception as e: 
+                logger.warning("Failed to calculate initial layout: %s", e)
                 try:
-                    for node in self.graph.nodes(): 
-                        node_sizes.append(max(min_size, min(max_size, base_size + size_per_char * len(truncated_labels.get(node, ' ')))))
-                except Exception as e: 
-                    node_sizes = [2500] * self.graph.number_of_nodes()
-                    
-            if len(node_sizes) != self.graph.number_of_nodes(): 
-                node_sizes = [2500] * self.graph.number_of_nodes()
-            
-            # Define colors
-            default_node_color = '#1f78b4'  # Regular project packages
-            external_node_color = '#7f007f'  # External dependencies
-            default_edge_color = 'black'
-            highlight_dep_color = 'red'
-            highlight_dee_color = 'blue'
-            selected_node_color = 'orange'
-            
-            # Set node colors based on node type
-            node_colors = {}
-            for node in self.graph.nodes():
-                if self.graph.nodes[node].get('is_external', False):
-                    node_colors[node] = external_node_color
-                else:
-                    node_colors[node] = default_node_color
-                    
-            edge_colors = {edge: default_edge_color for edge in self.graph.edges()}
-            edge_widths = {edge: 1.0 for edge in self.graph.edges()}
-            
-            # Handle highlighting
-            if highlight_node and self.graph.has_node(highlight_node):
-                node_colors[highlight_node] = selected_node_color
-                for u, v in self.graph.out_edges(highlight_node): 
-                    edge = (u, v)
-                    edge_colors[edge] = highlight_dep_color
-                    edge_widths[edge] = 2.0
-                    node_colors[v] = highlight_dep_color
-                for u, v in self.graph.in_edges(highlight_node): 
-                    edge = (u, v)
-                    edge_colors[edge] = highlight_dee_color
-                    edge_widths[edge] = 2.0
-                    node_colors[u] = highlight_dee_color
-            
-            # Draw the graph elements
-            nx.draw_networkx_edges(
-                self.graph, self.node_positions, ax=self.ax, 
-                edge_color=[edge_colors.get(edge, default_edge_color) for edge in self.graph.edges()], 
-                width=[edge_widths.get(edge, 1.0) for edge in self.graph.edges()], 
-                arrowstyle='-|>', arrowsize=15, connectionstyle='arc3,rad=0.1', 
-                node_size=node_sizes
-            )
-            
-            nx.draw_networkx_nodes(
-                self.graph, self.node_positions, ax=self.ax, 
-                node_size=node_sizes, 
-                node_color=[node_colors.get(node, default_node_color) for node in self.graph.nodes()], 
-                node_shape='o'
-            )
-            
-            # Customize node labels to indicate external packages
-            custom_labels = {}
-            for node in self.graph.nodes():
-                if node.startswith("ext:"):
-                    # For external packages, remove the prefix and show just the package name
-                    custom_labels[node] = truncate_label(node[4:], max_segments=2)  # Remove "ext:" prefix
-                else:
-                    custom_labels[node] = truncated_labels[node]
-                    
-            nx.draw_networkx_labels(
-                self.graph, self.node_positions, 
-                labels=custom_labels, ax=self.ax, 
-                font_size=8, font_color='white', font_weight='bold'
-            )
-            
-            # Set title
-            proj_name = os.path.basename(self.project_root) if self.project_root else 'N/A'
-            self.ax.set_title(f"Project: {proj_name}")
-
-            # Restore view limits if preserving view
-            if preserve_view:
-                self.ax.set_xlim(current_xlim)
-                self.ax.set_ylim(current_ylim)
+                    # Last resort - use shell layout or circular layout which don't need scipy
+                    logger.debug("Attempting circular_layout as last resort")
+                    self.node_positions = nx.circular_layout(self.graph)
+                except Exception as e2:
+                    messagebox.showerror("Layout Error", f"Failed to calculate any layout: {e2}")
+                    return
                 
-            # Update the canvas
-            self.canvas.draw()
-            
+        truncated_labels = self._truncated_labels
+
+        # Update the graph elements in their default (unhighlighted) colors.
+        # Highlighting is drawn on top as a separate, blitted overlay layer.
+        pos_arr = np.array([self.node_positions[n] for n in self._node_order], dtype=float).reshape(-1, 2)
+        size_arr = self._node_sizes
+
+        # Edge segments only change with the layout; the highlight overlay slices them by edge index
+        self._edge_segments = np.stack([pos_arr[self._edge_src], pos_arr[self._edge_dst]], axis=1)
+        self._edge_lines.set_segments(self._edge_segments)
+        self._edge_heads.set_edges(self._edge_segments[:, 0], self._edge_segments[:, 1], size_arr[self._edge_dst])
+
+        self._node_xy = pos_arr
+        self._edge_keep = None
+        self._node_coll.set_offsets(pos_arr)
+        self._node_coll.set_sizes(size_arr)
+        self._node_coll.set_facecolor(self._base_node_rgba)
+
+        # Level of detail: large graphs get faint edges without arrowheads, and
+        # labels only for the highlighted neighbourhood (see _update_highlight_artists)
+        n_nodes = len(self._node_order)
+        dense = n_nodes > EDGE_LOD_NODE_LIMIT
+        self._edge_lines.set_alpha(EDGE_LOD_ALPHA if dense else None)
+        self._edge_heads.set_visible(not dense)
+        show_labels = n_nodes <= LABEL_NODE_LIMIT
+
+        # Labels: drop those of removed nodes, add new ones, move the rest
+        for node in [n for n in self._label_artists if not show_labels or n not in self._node_index]:
+            self._label_artists.pop(node).remove()
+        if show_labels:
+            for node, (x, y) in zip(self._node_order, pos_arr):
+                text = self._label_artists.get(node)
+                if text is None:
+                    self._label_artists[node] = self._create_label(node, x, y, truncated_labels[node])
+                else:
+                    text.set_position((x, y))
+
+        # Set title
+        proj_name = os.path.basename(self.project_root) if self.project_root else 'N/A'
+        self.ax.set_title(f"Project: {proj_name}")
+
+        # Fit the view to the nodes unless the current zoom/pan should be kept
+        if not preserve_view:
+            self.ax.ignore_existing_data_limits = True
+            self.ax.update_datalim(pos_arr)
+            self.ax.set_autoscale_on(True)
+            self.ax.autoscale_view()
+
+        self._cull_to_view()
+
+        # Build the highlight overlay; it is drawn by _on_draw_event after the
+        # clean background has been captured.
+        self._update_highlight_artists(highlight_node)
+
+        # Update the canvas. draw_idle coalesces repeated requests within one
+        # gesture into a single render; the cached background is stale until then.
+        self._bg = None
+        self._request_draw()
+
+    def _create_base_artists(self):
+        """Clears the axes and creates the persistent edge, arrowhead and node collections."""
+        dark_gray = '#505050'
+        self.ax.clear()
+        self.ax.set_facecolor(dark_gray)
+        self.fig.set_facecolor(dark_gray)
+        self.ax.axis('off')
+
+        # Edges are rasterized in vector exports (toolbar "Save"), so a dense graph saves as one
+        # bitmap layer instead of thousands of paths; nodes and labels stay vector and crisp
+        self._edge_lines = LineCollection(
+            np.empty((0, 2, 2)), colors=DEFAULT_EDGE_COLOR, linewidths=1.0, zorder=1, rasterized=True
+        )
+        self.ax.add_collection(self._edge_lines, autolim=False)
+        self._edge_heads = ArrowheadCollection(
+            [], [], [], arrowsize=15, facecolors=DEFAULT_EDGE_COLOR, edgecolors='none', zorder=1, rasterized=True
+        )
+        self.ax.add_collection(self._edge_heads, autolim=False)
+        self._node_coll = self.ax.scatter(np.empty(0), np.empty(0), marker='o', zorder=2)
+        self._label_artists = {}
+        self._highlight_artists = []
+        self._highlight_labels = []
+        self._edge_keep = None
+        # Clearing the axes also drops their callbacks, so (re)connect here
+        self.ax.callbacks.connect('xlim_changed', self._cull_to_view)
+        self.ax.callbacks.connect('ylim_changed', self._cull_to_view)
+
+    def _cull_to_view(self, ax=None):
+        """Limits the drawn edges and labels to those near the current view.
+
+        Only applies when zoomed in past VIEW_CULL_MAX_FRACTION of the layout's
+        area; otherwise everything is drawn. Nodes are always drawn in full, since
+        the highlight overlay indexes the node collection by node order.
+        """
+        if self._edge_lines is None or len(self._node_xy) == 0:
+            return
+        # The index caches may already describe a different graph than the drawn one
+        if len(self._edge_segments) != len(self._edge_dst) or len(self._node_xy) != len(self._node_order):
+            return
+        (x0, x1), (y0, y1) = sorted(self.ax.get_xlim()), sorted(self.ax.get_ylim())
+        extent = np.ptp(self._node_xy, axis=0)
+        view_fraction = (x1 - x0) * (y1 - y0) / max(extent[0] * extent[1], 1e-12)
+        if view_fraction >= VIEW_CULL_MAX_FRACTION or not self.ax.bbox.width or not self.ax.bbox.height:
+            node_visible = None
+            edge_keep = None
+        else:
+            mx = VIEW_CULL_MARGIN_PX * (x1 - x0) / self.ax.bbox.width
+            my = VIEW_CULL_MARGIN_PX * (y1 - y0) / self.ax.bbox.height
+            x0, x1, y0, y1 = x0 - mx, x1 + mx, y0 - my, y1 + my
+            xy = self._node_xy
+            node_visible = (xy[:, 0] >= x0) & (xy[:, 0] <= x1) & (xy[:, 1] >= y0) & (xy[:, 1] <= y1)
+            # An edge stays if its bounding box overlaps the view (conservative for long edges)
+            lo = self._edge_segments.min(axis=1)
+            hi = self._edge_segments.max(axis=1)
+            edge_keep = (hi[:, 0] >= x0) & (lo[:, 0] <= x1) & (hi[:, 1] >= y0) & (lo[:, 1] <= y1)
+
+        unchanged = (edge_keep is None) == (self._edge_keep is None) and (
+            edge_keep is None or np.array_equal(edge_keep, self._edge_keep)
+        )
+        if not unchanged:
+            segments = self._edge_segments if edge_keep is None else self._edge_segments[edge_keep]
+            target_sizes = self._node_sizes[self._edge_dst if edge_keep is None else self._edge_dst[edge_keep]]
+            self._edge_lines.set_segments(segments)
+            self._edge_heads.set_edges(segments[:, 0], segments[:, 1], target_sizes)
+            self._edge_keep = edge_keep
+
+        for node, text in self._label_artists.items():
+            text.set_visible(node_visible is None or bool(node_visible[self._node_index[node]]))
+
+    def _update_highlight_artists(self, highlight_node):
+        """Replaces the overlay artists used to highlight a node and its neighbours.
+
+        The overlay artists are marked as animated, so they are excluded from the
+        regular figure draw (and thus from the cached background) and are only
+        rendered by _draw_highlight_artists.
+        """
+        for artist in self._highlight_artists:
+            if artist.axes is not None: # Already gone if the axes were cleared
+                artist.remove()
+        self._highlight_artists = []
+        self._highlight_labels = []
+
+        if not highlight_node or not self.graph or not self.graph.has_node(highlight_node):
+            return
+
+        no_edges = np.empty(0, dtype=np.int32)
+        out_ix = self._out_edge_idx.get(highlight_node, no_edges)
+        in_ix = self._in_edge_idx.get(highlight_node, no_edges)
+        edge_ix = np.concatenate([out_ix, in_ix])
+        if len(edge_ix):
+            edge_rgba = np.empty((len(edge_ix), 4))
+            edge_rgba[:len(out_ix)] = HIGHLIGHT_DEP_RGBA
+            edge_rgba[len(out_ix):] = HIGHLIGHT_DEE_RGBA
+            self._highlight_artists.extend(self._draw_edges(edge_ix, edge_rgba, width=2.0))
+
+        # Node colors for just the highlighted nodes (selected node first), so the
+        # work scales with the neighbourhood rather than the whole graph
+        succ_ix = self._edge_dst[out_ix]
+        pred_ix = self._edge_src[in_ix]
+        h_ix = self._node_index[highlight_node]
+        highlighted_ix = list(dict.fromkeys([h_ix, *succ_ix.tolist(), *pred_ix.tolist()]))
+        is_dependent = np.isin(highlighted_ix, pred_ix) # Dependents win on cycles, as before
+        node_rgba = np.where(is_dependent[:, None], HIGHLIGHT_DEE_RGBA, HIGHLIGHT_DEP_RGBA)
+        node_rgba[0] = SELECTED_NODE_RGBA
+        highlighted = [self._node_order[i] for i in highlighted_ix]
+        # Positions come straight from the base node collection, in the same node order
+        xy = self._node_coll.get_offsets()[highlighted_ix]
+        node_coll = self.ax.scatter(
+            xy[:, 0], xy[:, 1], s=self._node_sizes[highlighted_ix], c=node_rgba, marker='o', zorder=2
+        )
+        self._highlight_artists.append(node_coll)
+        for artist in self._highlight_artists:
+            artist.set_animated(True)
+        # The overlay nodes cover the labels in the background, so redraw those labels on top
+        self._highlight_labels = [self._label_artists[n] for n in highlighted if n in self._label_artists]
+        # Large graphs have no background labels; label just the highlighted neighbourhood
+        for n in highlighted:
+            if n not in self._label_artists:
+                x, y = self.node_positions[n]
+                text = self._create_label(n, x, y, self._truncated_labels[n])
+                text.set_animated(True)
+                self._highlight_artists.append(text)
+
+    def _create_label(self, node, x, y, truncated_label):
+        """Adds the Text artist that labels a node."""
+        if node.startswith("ext:"):
+            # For external packages, remove the prefix and show just the package name
+            label = truncate_label(node[4:], max_segments=2)  # Remove "ext:" prefix
+        else:
+            label = truncated_label
+        return self.ax.text(
+            x, y, label, size=8, color='white', weight='bold',
+            horizontalalignment='center', verticalalignment='center', clip_on=True
+        )
+
+    def _draw_edges(self, edge_ix, edge_color, width):
+        """Draws the edges with the given indices (into self._edge_list) as one
+        LineCollection plus one ArrowheadCollection.
+
+        Used for the highlight overlay (the base edges are persistent collections
+        updated by draw_graph). Returns the list of artists added to the axes.
+        """
+        if not len(edge_ix):
+            return []
+        segments = self._edge_segments[edge_ix]
+        sources, targets = segments[:, 0], segments[:, 1]
+        target_sizes = self._node_sizes[self._edge_dst[edge_ix]]
+        # Rasterized in vector exports like the base edge layer
+        lines = LineCollection(segments, colors=edge_color, linewidths=width, zorder=1, rasterized=True)
+        self.ax.add_collection(lines, autolim=False)
+        heads = ArrowheadCollection(
+            sources, targets, target_sizes, arrowsize=15,
+            facecolors=edge_color, edgecolors='none', zorder=1, rasterized=True
+        )
+        self.ax.add_collection(heads, autolim=False)
+        return [lines, heads]
+
+    def _draw_highlight_artists(self, renderer=None):
+        """Draws the highlight overlay onto the current canvas buffer, or with renderer if given."""
+        for artist in self._highlight_artists + self._highlight_labels:
+            if artist.axes is None: # Detached if the axes were cleared since
+                continue
+            if renderer is None:
+                self.ax.draw_artist(artist)
+            else:
+                artist.draw(renderer)
+
+    def _on_draw_event(self, event):
+        """Caches the clean graph background after every full draw and re-applies the highlight."""
+        # savefig also fires draw_event, possibly on a vector canvas swapped in for
+        # the export. That render is not the screen background, so only add the
+        # (animated, thus otherwise skipped) overlay to the exported figure
+        if event.canvas is not self.canvas or self.canvas.is_saving():
+            self._draw_highlight_artists(event.renderer)
+            return
+        self._bg = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._disp_pts = None # View may have changed; rebuild the hit-testing index on demand
+        self._draw_highlight_artists()
+
+    def _on_resize(self, event):
+        """Drops the cached background; it is recaptured by the next full draw."""
+        self._bg = None
+        self._disp_pts = None
+
+    def _highlight(self, highlight_node):
+        """Updates the selection highlight by blitting over the cached background
+        instead of redrawing every node and edge."""
+        self._update_highlight_artists(highlight_node)
+        self._request_draw(full=False)
+
+    def _request_draw(self, full=True):
+        """Shows pending changes: a full (idle) draw, or just a re-blit of the highlight.
+
+        Inside a _hold_draw() block the request is only recorded, and the strongest
+        request is issued once when the block ends.
+        """
+        if self._draw_held:
+            if full or self._pending_draw is None:
+                self._pending_draw = 'full' if full else 'blit'
+            return
+        if full or self._bg is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._bg)
+        self._draw_highlight_artists()
+        self.canvas.blit(self.ax.bbox)
+
+    @contextmanager
+    def _hold_draw(self):
+        """Batches the redraws requested by one user gesture into a single draw on exit."""
+        outer = self._draw_held
+        self._draw_held = True
+        try:
+            yield
         finally:
-            pass
+            self._draw_held = outer
+            if not outer and self._pending_draw is not None:
+                full = self._pending_draw == 'full'
+                self._pending_draw = None
+                self._request_draw(full=full)
 
     def on_click(self, event):
         """Handles single and double clicks, and right-click for delete."""
@@ -784,57 +1453,65 @@ Raw output:
             abs(event.y - self._last_click_event.y) < 5):
             is_double_click = True
             self._last_click_time = 0 # Reset time
-            #print("DEBUG: Double-click detected (manual detection)") # Re-enable print
         else:
             self._last_click_time = current_time
             self._last_click_event = event
 
+        # Any further click supersedes a single-click action still waiting out the
+        # double-click window (in particular the first click of a double-click)
+        if self._pending_single_click is not None:
+            self.after_cancel(self._pending_single_click)
+            self._pending_single_click = None
+
         # --- Right-Click Action (Button 3) ---
         if event.button == 3: # Restore original 'if'
-            # print(f"Right-click detected. Node: {clicked_node}")
+            logger.debug("Right-click on node: %s", clicked_node)
             if clicked_node:
-                self.delete_node(clicked_node)
+                with self._hold_draw():
+                    self.delete_node(clicked_node)
             return
 
         # --- Double-Click Action (Button 1) ---
         elif event.button == 1 and is_double_click:
-            #print(f"DEBUG: Double-click detected on node: {clicked_node}") # Re-enable print
+            logger.debug("Double-click on node: %s", clicked_node)
             if clicked_node:
                 self.handle_double_click(event)
             return
 
         # --- Single-Click Action (Button 1) ---
         elif event.button == 1 and not is_double_click:
-             # print(f"Left-click processing. Node: {clicked_node}")
+            logger.debug("Left-click on node: %s", clicked_node)
+            if not clicked_node:
+                # A background click only clears the selection; a double-click on
+                # the background does nothing, so there is nothing to wait for
+                if self.selected_node:
+                    self.selected_node = None
+                    with self._hold_draw():
+                        self._highlight(None)
+                return
+
             def delayed_single_click_action():
-                if time.time() - self._last_click_time > self._double_click_threshold:
-                    if clicked_node:
-                        if self.selected_node == clicked_node:
-                            self.selected_node = None
-                        else:
-                            self.selected_node = clicked_node
-                    else:
-                        if self.selected_node:
-                            self.selected_node = None
-                    
-                    current_xlim = self.ax.get_xlim()
-                    current_ylim = self.ax.get_ylim()
-                    
-                    self.draw_graph(highlight_node=self.selected_node, preserve_view=True)
-                    
-                    self.ax.set_xlim(current_xlim)
-                    self.ax.set_ylim(current_ylim)
-                    self.canvas.draw()
-            
-            self.after(int(self._double_click_threshold * 1000), delayed_single_click_action)
+                self._pending_single_click = None
+                if self.selected_node == clicked_node:
+                    self.selected_node = None
+                else:
+                    self.selected_node = clicked_node
+
+                # Only the highlight changes, so blit it over the cached background
+                with self._hold_draw():
+                    self._highlight(self.selected_node)
+
+            self._pending_single_click = self.after(
+                int(self._double_click_threshold * 1000), delayed_single_click_action
+            )
 
     def handle_double_click(self, event):
         """Handles double-click events for node explosion."""
-        #print(f"DEBUG: Handling double click...") # Re-enable print
         node_to_explode = self.find_node_at_pos(event.x, event.y)
         if node_to_explode:
-           # print(f"DEBUG: Attempting to explode node: {node_to_explode}") # Re-enable print
-            self.explode_module(node_to_explode)
+            logger.debug("Exploding node: %s", node_to_explode)
+            with self._hold_draw():
+                self.explode_module(node_to_explode)
         
 
     def explode_module(self, node_id):
@@ -842,6 +1519,8 @@ Raw output:
         rewiring edges based on detailed file-level dependencies from tach_data.
         """
         # --- Prerequisites ---
+        if self._busy:
+            return # A load or layout is still running on the worker thread
         if not hasattr(self, 'tach_project_root') or not self.tach_project_root:
             messagebox.showerror("Error", "Tach project root not determined. Cannot explode.")
             return
@@ -852,7 +1531,7 @@ Raw output:
              messagebox.showerror("Error", "Tach data not available. Cannot accurately explode node.")
              return # Need tach_data for accurate rewiring
 
-        print(f"Exploding package/directory: {node_id}")
+        logger.debug("Exploding package/directory: %s", node_id)
 
         # --- 1. Find immediate children (submodules/subpackages/scripts) ---
         # Use '.' for the root node if node_id is '.'
@@ -874,180 +1553,172 @@ Raw output:
 
         if not is_directory_like:
              # This node might represent a single module/script already
-             #print(f"Node '{node_id}' does not appear to be a directory: {potential_dir}. Assuming it's already exploded.")
+             logger.debug("Node %r is not a directory (%s); nothing to explode", node_id, potential_dir)
              messagebox.showinfo("Cannot Explode", f"Node '{node_id}' does not seem to be a package or directory that can be exploded further.")
              return
 
         children_details = {} # Store { child_node_id: child_file_path }
         try:
-            for item in os.listdir(potential_dir):
-                item_path_abs = os.path.join(potential_dir, item)
-                # item_path_rel = os.path.relpath(item_path_abs, self.tach_project_root).replace('\\\\', '/') # Old way
-
-                # --- Use pathlib for robust relative path and name derivation ---
-                try:
-                    p_rel = Path(item_path_abs).relative_to(self.tach_project_root)
-                    normalized_rel_path = p_rel.as_posix() # Path with forward slashes
-                except ValueError as e:
-                    print(f"  Warning: Could not get relative path for {item_path_abs}: {e}")
-                    continue # Skip this item
-
-                child_id = None
-                representative_file_path = None
-                # Check if it's a directory containing __init__.py (sub-package)
-                if os.path.isdir(item_path_abs) and os.path.exists(os.path.join(item_path_abs, '__init__.py')):
-                    # Node name is the dot-separated directory path
-                    child_id = normalized_rel_path.replace('/', '.') # e.g., 'pkg_b.sub_b'
-                    # Store the path to the __init__.py as the representative file
-                    representative_file_path = (p_rel / '__init__.py').as_posix()
-
-                # Check if it's a .py file (sub-module/script)
-                elif os.path.isfile(item_path_abs) and item.endswith('.py') and item != '__init__.py':
-                    # Node name is dot-separated path excluding extension
-                    base_path = os.path.splitext(normalized_rel_path)[0] # e.g., 'pkg_b/sub_b/logic_b'
-                    child_id = base_path.replace('/', '.') # e.g., 'pkg_b.sub_b.logic_b'
-                    representative_file_path = normalized_rel_path # Store the .py file path
-
-                # --- Store child details if found ---
-                if child_id and representative_file_path:
-                     children_details[child_id] = representative_file_path
+            # --- Use pathlib once for the directory's relative path; children just append their name ---
+            try:
+                rel_dir = Path(potential_dir).relative_to(self.tach_project_root).as_posix()
+            except ValueError as e:
+                logger.warning("Could not get relative path for %s: %s", potential_dir, e)
+                rel_dir = None
+            rel_prefix = '' if rel_dir in (None, '.') else rel_dir + '/'
+
+            # scandir returns the entry type with the directory read, so each item
+            # does not need its own isdir/isfile stat call
+            # (nothing can be named if the directory lies outside the project root)
+            with os.scandir(potential_dir) as entries:
+                for entry in (entries if rel_dir is not None else ()):
+                    normalized_rel_path = rel_prefix + entry.name # Path with forward slashes
+
+                    child_id = None
+                    representative_file_path = None
+                    # Check if it's a directory containing __init__.py (sub-package)
+                    if entry.is_dir():
+                        if os.path.exists(os.path.join(entry.path, '__init__.py')):
+                            # Node name is the dot-separated directory path
+                            child_id = normalized_rel_path.replace('/', '.') # e.g., 'pkg_b.sub_b'
+                            # Store the path to the __init__.py as the representative file
+                            representative_file_path = normalized_rel_path + '/__init__.py'
+
+                    # Check if it's a .py file (sub-module/script)
+                    elif entry.name.endswith('.py') and entry.name != '__init__.py' and entry.is_file():
+                        # Node name is dot-separated path excluding extension
+                        base_path = normalized_rel_path[:-3] # e.g., 'pkg_b/sub_b/logic_b'
+                        child_id = base_path.replace('/', '.') # e.g., 'pkg_b.sub_b.logic_b'
+                        representative_file_path = normalized_rel_path # Store the .py file path
+
+                    # --- Store child details if found ---
+                    if child_id and representative_file_path:
+                         children_details[child_id] = representative_file_path
 
         except OSError as e:
              messagebox.showerror("Error", f"Error accessing sub-items for '{node_id}': {e}")
              return
 
         if not children_details:
-            #print(f"No children (sub-packages or modules/scripts) found for {node_id}")
+            logger.debug("No children found for %s", node_id)
             messagebox.showinfo("No Children", f"No sub-packages or modules/scripts found within '{node_id}' to explode.")
             return
 
-        #print(f"Found {len(children_details)} direct children for {node_id}: {list(children_details.keys())}")
-
-        # --- 2. Modify Graph ---
-        self._save_history() # Save state *before* modification
-
-        new_graph = self.graph.copy()
-        new_positions = self.node_positions.copy() if self.node_positions else {}
+        logger.debug("Found %d direct children for %s", len(children_details), node_id)
+
+        # --- 2. Modify Graph (in place) ---
+        # Instead of snapshotting the whole graph, journal just what this explosion
+        # changes so undo can replay it in reverse.
+        new_graph = self.graph
+        new_positions = self.node_positions if self.node_positions is not None else {}
+        delta = {
+            'removed_node': node_id,
+            'removed_node_attrs': dict(new_graph.nodes[node_id]),
+            'removed_edges': list(new_graph.in_edges(node_id)) + list(new_graph.out_edges(node_id)),
+            'positions_removed': {},
+            'added_nodes': [],
+            'added_edges': [],
+        }
 
         # Store original node info & remove original node
         original_pos = new_positions.pop(node_id, None)
-        if new_graph.has_node(node_id):
-             new_graph.remove_node(node_id)
-       
-
-
-        # Add new nodes for children & estimate initial positions
-        child_nodes = list(children_details.keys())
-        for child_id in child_nodes:
-             if not new_graph.has_node(child_id):
-                 new_graph.add_node(child_id, is_external=False)
-                 if original_pos is not None:
-                      # Simple offset logic for initial placement
-                      offset_x = (hash(child_id) % 200 - 100) / 1000.0
-                      offset_y = (hash(child_id) % 100 - 50) / 1000.0
-                      new_positions[child_id] = (original_pos[0] + offset_x, original_pos[1] + offset_y)
-                 else:
-                      new_positions[child_id] = (0.5, 0.5) # Fallback position
-             
+        if original_pos is not None:
+            delta['positions_removed'][node_id] = original_pos
+        new_graph.remove_node(node_id)
+
+        # Add new nodes for children & seed them on a small circle around the
+        # exploded node, so the layout only has to settle the new nodes
+        child_nodes = [c for c in children_details if not new_graph.has_node(c)]
+        delta['added_nodes'] = child_nodes
+        layout_span = self._layout_span(new_positions)
+        center = original_pos if original_pos is not None else (0.5, 0.5) # Fallback position
+        radius = 0.05 * layout_span
+        new_graph.add_nodes_from(child_nodes, is_external=False)
+        for i, child_id in enumerate(child_nodes):
+            angle = 2.0 * math.pi * i / len(child_nodes)
+            new_positions[child_id] = (center[0] + radius * math.cos(angle), center[1] + radius * math.sin(angle))
 
         # --- 3. Rebuild Edges based on tach_data ---
-        print("Rebuilding edges based on tach_data...")
-        added_edges = set()
+        logger.debug("Rebuilding edges based on tach_data...")
+        # Each file is mapped to its node once (the same files recur across the map),
+        # edges are collected in order without duplicates, and only the ones not
+        # already in the graph are inserted and journaled.
+        node_for_file = {}
+        def map_file(filepath):
+            if filepath not in node_for_file:
+                node_for_file[filepath] = self._map_filepath_to_graph_node(filepath, new_graph)
+            return node_for_file[filepath]
+
+        mapped_edges = {}
         for source_filepath, target_filepaths in self.tach_data.items():
             # Map source filepath to a node in the *new* graph state
-            source_node = self._map_filepath_to_graph_node(source_filepath, new_graph)
-            # --- DEBUG START ---
-            # print(f"Processing source: {source_filepath} -> Mapped Node: {source_node}")
-            # --- DEBUG END ---
-
-            if source_node:
-                for target_filepath in target_filepaths:
-                    # Map target filepath to a node in the *new* graph state
-                    target_node = self._map_filepath_to_graph_node(target_filepath, new_graph)
-                    # --- DEBUG START ---
-                    mapped_edge_info = f"  Target: {target_filepath} -> Mapped Node: {target_node}"
-                    # --- DEBUG END ---
-
-                    if target_node and source_node != target_node:
-                        # Add edge if both nodes exist in the new graph and are different
-                        edge = (source_node, target_node)
-                        if edge not in added_edges:
-                             # --- DEBUG START ---
-                             #print(f"DEBUG: Adding Edge | {mapped_edge_info} | Result: {source_node} -> {target_node}")
-                             # --- DEBUG END ---
-                             new_graph.add_edge(source_node, target_node)
-                             added_edges.add(edge)
-                             # print(f"  Added edge: {source_node} -> {target_node} (from {source_filepath} -> {target_filepath})")
-                    # --- DEBUG START ---
-                    # else:
-                         # Optional: Print why edge wasn't added
-                         # reason = ""
-                         # if not target_node: reason = "Target node not found in graph."
-                         # elif source_node == target_node: reason = "Source and target map to same node."
-                         # print(f"DEBUG: Skipping Edge | {mapped_edge_info} | Reason: {reason}")
-                    # --- DEBUG END ---
-
-
-        self.graph = new_graph
-
-        # --- 4. Adjust Layout ---
-        # (Layout logic remains similar, using new_positions as initial state)
-        if self.graph.number_of_nodes() > 1:
-            try:
-                #print("Adjusting layout after explosion...")
-                current_positions_for_layout = {n: p for n, p in new_positions.items() if n in self.graph}
+            source_node = map_file(source_filepath)
+            if not source_node:
+                continue
+            for target_filepath in target_filepaths:
+                target_node = map_file(target_filepath)
+                # Add edge if both nodes exist in the new graph and are different
+                if target_node and source_node != target_node:
+                    mapped_edges[(source_node, target_node)] = None
+        delta['added_edges'] = [edge for edge in mapped_edges if not new_graph.has_edge(*edge)]
+        new_graph.add_edges_from(delta['added_edges'])
 
-                if PYGRAPHVIZ_INSTALLED:
-                     # If using graphviz, maybe just recalculate dot?
-                     # Or does spring layout work better after explosion? Let's stick to spring for consistency post-explosion.
-                     #print("Using spring_layout for post-explosion adjustment (PyGraphviz available but spring preferred here)")
-                     if SCIPY_INSTALLED:
-                         k = 0.8 / (self.graph.number_of_nodes()**0.5) # Heuristic for k
-                         self.node_positions = nx.spring_layout(self.graph, pos=current_positions_for_layout, k=k, iterations=30, seed=42)
-                     else:
-                         #print("Falling back to circular layout post-explosion (scipy not available)")
-                         self.node_positions = nx.circular_layout(self.graph) # Less ideal adjustment
-
-                elif SCIPY_INSTALLED:
-                    k = 0.8 / (self.graph.number_of_nodes()**0.5) # Heuristic for k
-                    self.node_positions = nx.spring_layout(self.graph, pos=current_positions_for_layout, k=k, iterations=30, seed=42)
-                else:
-                    #print("Using circular_layout for post-explosion adjustment (scipy not available)")
-                    # Simple circular layout if no better option
-                    self.node_positions = nx.circular_layout(self.graph)
-
-                print("Layout adjustment complete.")
-            except Exception as e_layout:
-                print(f"Error during layout adjustment: {e_layout}. Using estimated positions.")
-                # Fallback to the initially estimated positions if layout fails
-                self.node_positions = {n: p for n, p in new_positions.items() if n in self.graph}
-        else:
-            self.node_positions = {n: p for n, p in new_positions.items() if n in self.graph} # Use directly if only 0 or 1 node
+        self._save_history(delta)
+        self._rebuild_index_caches()
 
+        # --- 4. Adjust Layout ---
+        # Incremental update: existing nodes stay pinned and only the new children
+        # are relaxed for a few iterations, instead of re-running the whole layout.
+        # The seeded positions are drawn right away; the relaxed layout replaces
+        # them once the worker thread has computed it.
+        new_positions = {n: p for n, p in new_positions.items() if n in self.graph}
+        self.node_positions = new_positions
 
         # --- 5. Finalize and Redraw ---
         self.selected_node = None # Clear selection after explosion
         self.undo_button.configure(state="normal")
 
-        #print(f"Exploded {node_id}. New graph: {self.graph.number_of_nodes()} nodes, {self.graph.number_of_edges()} edges")
-        self.draw_graph() # Redraw with updated graph and adjusted positions
+        logger.debug("Exploded %s. New graph: %d nodes, %d edges", node_id, self.graph.number_of_nodes(), self.graph.number_of_edges())
+        self.draw_graph() # Redraw with updated graph and seeded positions
+
+        if child_nodes and self.graph.number_of_nodes() > len(child_nodes) and SCIPY_INSTALLED:
+            graph = self.graph
+            new_children = set(child_nodes)
+            pinned = [n for n in graph if n not in new_children]
+            k = 0.8 * layout_span / (graph.number_of_nodes()**0.5) # Heuristic for k, in layout units
+            self._relayout_in_background(
+                lambda: nx.spring_layout(graph, pos=new_positions, fixed=pinned, k=k, iterations=10, seed=42)
+            )
 
     def delete_node(self, node_id):
         """Deletes a node and its edges from the graph."""
+        if self._busy:
+            return
         if not self.graph or not self.graph.has_node(node_id):
-            print(f"Error: Node '{node_id}' not found for deletion.")
+            logger.error("Node '%s' not found for deletion.", node_id)
             return
         
-        print(f"Deleting node: {node_id}")
-        self._save_history() # Save state BEFORE deleting
+        logger.debug("Deleting node: %s", node_id)
+        # Journal the node, its attributes, edges and position so undo can restore them
+        delta = {
+            'removed_node': node_id,
+            'removed_node_attrs': dict(self.graph.nodes[node_id]),
+            'removed_edges': list(self.graph.in_edges(node_id)) + list(self.graph.out_edges(node_id)),
+            'positions_removed': {},
+            'added_nodes': [],
+            'added_edges': [],
+        }
         
-        new_graph = self.graph.copy()
-        new_graph.remove_node(node_id)
-        self.graph = new_graph
+        self.graph.remove_node(node_id)
         
         # Remove node position
         if self.node_positions:
-            self.node_positions.pop(node_id, None) 
+            pos = self.node_positions.pop(node_id, None)
+            if pos is not None:
+                delta['positions_removed'][node_id] = pos
+        
+        self._save_history(delta)
+        self._rebuild_index_caches()
             
         # Deselect if the deleted node was selected
         if self.selected_node == node_id:
@@ -1056,89 +1727,137 @@ Raw output:
         # Ensure undo button is enabled (it should be after _save_history)
         self.undo_button.configure(state="normal") 
         
-        #print(f"Deleted {node_id}. New graph: {self.graph.number_of_nodes()} nodes, {self.graph.number_of_edges()} edges")
+        logger.debug("Deleted %s. New graph: %d nodes, %d edges", node_id, self.graph.number_of_nodes(), self.graph.number_of_edges())
         self.draw_graph() # Redraw without the node
 
     def undo_last_action(self, event=None):
         """Reverts the last graph modification (explosion, deletion) and adjusts layout."""
+        if self._busy:
+            return
         if not self.history:
-            print("No history to undo.")
+            logger.debug("No history to undo.")
             return
 
-        print("Undoing last action...")
-        last_state = self.history.pop()
-        self.graph = last_state['graph']
-        restored_positions = last_state['positions'] 
+        logger.debug("Undoing last action...")
+        delta = self.history.pop()
+        # Replay the journaled change in reverse on the live graph
+        self.graph.remove_nodes_from(delta['added_nodes'])
+        self.graph.remove_edges_from(delta['added_edges'])
+        self.graph.add_node(delta['removed_node'], **delta['removed_node_attrs'])
+        self.graph.add_edges_from(delta['removed_edges'])
+        self._rebuild_index_caches()
+        restored_positions = self.node_positions if self.node_positions is not None else {}
+        for n in delta['added_nodes']:
+            restored_positions.pop(n, None)
+        restored_positions.update(delta['positions_removed'])
         self.selected_node = None # Clear selection after undo
-
-        # Adjust layout based on restored state
-        if self.graph and restored_positions and self.graph.number_of_nodes() > 1:
-            try:
-                print("Adjusting layout after undo...")
-                # Use scipy if available, otherwise use alternatives
-                if SCIPY_INSTALLED:
-                    k = 0.8 / (self.graph.number_of_nodes()**0.5)
-                    self.node_positions = nx.spring_layout(self.graph, pos=restored_positions, k=k, iterations=30, seed=42)
-                else:
-                    # Just use the restored positions directly
-                    print("Using restored positions directly (scipy not available)")
-                    self.node_positions = restored_positions
-                print("Layout adjustment complete.")
-            except Exception as e_layout:
-                print(f"Error during layout adjustment: {e_layout}. Using restored positions directly.")
-                self.node_positions = restored_positions 
-        else:
-            self.node_positions = restored_positions 
-
+        self.node_positions = restored_positions 
 
         if not self.history:
             self.undo_button.configure(state="disabled")
         else: # Ensure it's enabled if history still exists
             self.undo_button.configure(state="normal")
 
-        print(f"Restored graph: {self.graph.number_of_nodes()} nodes, {self.graph.number_of_edges()} edges")
+        logger.debug("Restored graph: %d nodes, %d edges", self.graph.number_of_nodes(), self.graph.number_of_edges())
+        # No relayout: explode/delete only ever move the nodes they add, so the
+        # restored positions are exactly the layout from before the undone action
+        # (draw_graph still computes a full layout if a position is missing).
         self.draw_graph()
 
-    def _save_history(self):
-        """Saves the current graph state to the history stack."""
-        if self.graph:
-             # Deep copy might be safer if node attributes are mutable, but shallow should work for topology
-             graph_copy = self.graph.copy()
-             pos_copy = self.node_positions.copy() if self.node_positions else None
-             self.history.append({'graph': graph_copy, 'positions': pos_copy})
-             print(f"Saved state to history. History size: {len(self.history)}")
-             if len(self.history) > 0:
-                  self.undo_button.configure(state="normal")
+    def _relayout_in_background(self, compute_layout):
+        """Runs compute_layout() on the worker thread and redraws with its positions.
+
+        Until it finishes, the graph stays drawn with the current positions.
+        """
+        def on_done(future):
+            try:
+                self.node_positions = future.result()
+                logger.debug("Layout adjustment complete.")
+            except Exception as e_layout:
+                logger.warning("Error during layout adjustment: %s. Keeping estimated positions.", e_layout)
+                return
+            self.draw_graph(highlight_node=self.selected_node)
+
+        self._run_in_background(compute_layout, on_done)
+
+    def _save_history(self, delta):
+        """Pushes a reverse delta for the last graph modification onto the history stack.
+
+        The delta records the node that was removed (with its attributes, edges and
+        position) and the nodes/edges that were added in its place, so undo can
+        restore the previous state without keeping full graph copies around.
+        """
+        self.history.append(delta)
+        logger.debug("Saved state to history. History size: %d", len(self.history))
+        self.undo_button.configure(state="normal")
+
+    def _rebuild_spatial_index(self):
+        """Transforms all node positions to display coordinates in one call and indexes them."""
+        self._hover_cache.clear()
+        self._kdtree_nodes = list(self.node_positions)
+        pts = np.asarray([self.node_positions[n] for n in self._kdtree_nodes], dtype=float)
+        self._disp_pts = self.ax.transData.transform(pts)
+        if SCIPY_INSTALLED:
+            from scipy.spatial import cKDTree
+            self._kdtree = cKDTree(self._disp_pts)
+        else:
+            self._kdtree = None
+
+    def _hover_node_at(self, x, y):
+        """find_node_at_pos memoized per HOVER_BUCKET_PX pixel bucket.
+
+        Motion events arrive for every pixel the cursor moves; while it lingers
+        within one bucket the previous answer is reused. The cache is dropped
+        whenever the spatial index is stale or rebuilt (draw, resize, new graph).
+        """
+        if self._disp_pts is None or len(self._kdtree_nodes) != len(self.node_positions):
+            self._hover_cache.clear()
+        key = (int(x) // HOVER_BUCKET_PX, int(y) // HOVER_BUCKET_PX)
+        if key in self._hover_cache:
+            self._hover_cache.move_to_end(key)
+            return self._hover_cache[key]
+        node = self.find_node_at_pos(x, y)
+        self._hover_cache[key] = node
+        if len(self._hover_cache) > HOVER_CACHE_SIZE:
+            self._hover_cache.popitem(last=False)
+        return node
 
     def find_node_at_pos(self, x, y):
         """Finds the graph node closest to the click coordinates (x, y)."""
         if not self.node_positions:
             return None
 
-        min_dist_sq = float('inf')
-        closest_node = None
+        if self._disp_pts is None or len(self._kdtree_nodes) != len(self.node_positions):
+            self._rebuild_spatial_index()
 
-        for node, (nx_pos, ny_pos) in self.node_positions.items():
-            # Convert node position (data coords) to display coords for accurate distance check
-            disp_x, disp_y = self.ax.transData.transform((nx_pos, ny_pos))
-            dist_sq = (disp_x - x)**2 + (disp_y - y)**2
-            if dist_sq < min_dist_sq:
-                min_dist_sq = dist_sq
-                closest_node = node
+        if self._kdtree is not None:
+            min_dist, idx = self._kdtree.query((x, y))
+            min_dist_sq = min_dist**2
+        else:
+            dist_sq = ((self._disp_pts - (x, y))**2).sum(axis=1)
+            idx = int(np.argmin(dist_sq))
+            min_dist_sq = dist_sq[idx]
+        closest_node = self._kdtree_nodes[idx]
 
         # Define a tolerance threshold (e.g., based on node size in display coordinates)
         # This needs refinement - maybe check if click is within node bounds?
         # For now, use a generous pixel distance threshold
         click_tolerance_pixels_sq = 30**2
         if min_dist_sq < click_tolerance_pixels_sq:
-             print(f"DEBUG: Click near node: {closest_node}") # Re-enable print
+             logger.debug("Click near node: %s", closest_node)
              return closest_node
         else:
-             # print(f"Click not close enough to any node (min_dist_sq={min_dist_sq:.2f})")
+             logger.debug("Click not close enough to any node (min_dist_sq=%.2f)", min_dist_sq)
              return None
 
     def load_dependencies(self):
-        """Loads dependencies using tach, calculates layout, and displays the graph."""
+        """Loads dependencies using tach, calculates layout, and displays the graph.
+
+        Tach, the graph build and the initial layout run on the worker thread;
+        the result is drawn by _on_load_done on the Tk thread.
+        """
+        if self._busy:
+            return
         print("Loading dependencies...")
         # Reset graph-related state before loading
         self.graph = None
@@ -1147,77 +1866,181 @@ Raw output:
         self.history = []
         self.undo_button.configure(state="disabled")
         self.tach_data = None # Explicitly clear previous data
+        self._file_node_keys = {}
+        self._dir_listings = {}
+        self._rebuild_index_caches()
 
-        tach_data = self.run_tach()
-        if tach_data:
-            self.tach_data = tach_data # Assign the data to the instance variable
-            self.graph = self.build_graph_from_tach(self.tach_data) # Use the instance variable
-            if self.graph:
-                # Calculate initial layout here
-                print("Calculating initial graph layout...")
+        config_content = self._prepare_tach_run() # Reads the UI, so stays on the Tk thread
+        if config_content is None:
+            self._show_load_failure("Failed to load data from tach")
+            return
+        self._run_in_background(lambda: self._load_graph(config_content), self._on_load_done)
+
+    def _load_graph(self, config_content):
+        """Runs tach, builds the package graph and its initial layout (worker thread, no Tk calls).
+
+        Returns (tach_data, graph, positions); graph/positions are None when that step failed.
+        """
+        if SCIPY_INSTALLED:
+            import scipy.spatial # Warm the deferred import here so the first click does not pay for it
+        tach_data = self._compute_tach_map(config_content)
+        if not tach_data:
+            return tach_data, None, None
+        graph = self.build_graph_from_tach(tach_data)
+        if not graph:
+            return tach_data, graph, None
+        # Reuse the layout of an identical graph from a previous load if there is one
+        layout_key = layout_cache_key(graph)
+        positions = load_cached_layout(layout_key, graph)
+        if positions is not None:
+            print("Initial layout loaded from cache.")
+            return tach_data, graph, positions
+        # Calculate initial layout here
+        print("Calculating initial graph layout...")
+        try:
+            positions = self._compute_initial_layout(graph)
+        except Exception as e_manual:
+            raise LoadError("Layout Error", 
+                f"Failed to calculate any layout: {e_manual}\n\n"
+                "This might be due to missing dependencies or an extremely large graph.") from e_manual
+        store_cached_layout(layout_key, positions)
+        return tach_data, graph, positions
+
+    def _compute_initial_layout(self, graph):
+        """Computes the initial layout of a freshly loaded graph, trying the best available algorithm first."""
+        try:
+            # First try: Use pygraphviz if available
+            if PYGRAPHVIZ_INSTALLED:
                 try:
-                    # First try: Use pygraphviz if available
-                    if PYGRAPHVIZ_INSTALLED:
-                        try:
-                            self.node_positions = nx_agraph.graphviz_layout(self.graph, prog='dot')
-                            print("Initial layout complete (using pygraphviz dot).")
-                        except Exception as e_gv:
-                            print(f"Initial pygraphviz failed: {e_gv}. Falling back to spring_layout.")
-                            if SCIPY_INSTALLED:
-                                # Second try: Use spring_layout with networkx (requires scipy)
-                                self.node_positions = nx.spring_layout(self.graph, seed=42)
-                                print("Initial layout complete (spring_layout fallback).")
-                            else:
-                                # Use circular layout if scipy not available
-                                print("Using circular_layout (scipy not available)")
-                                self.node_positions = nx.circular_layout(self.graph)
-                                print("Initial layout complete (circular_layout fallback).")
-                    else:
-                        if SCIPY_INSTALLED:
-                            # For no pygraphviz: Try spring_layout first (requires scipy)
-                            self.node_positions = nx.spring_layout(self.graph, seed=42)
-                            print("Initial layout complete (spring_layout - pygraphviz not installed).")
-                        else:
-                            # Use circular layout if scipy not available
-                            print("Using circular_layout (scipy not available)")
-                            self.node_positions = nx.circular_layout(self.graph)
-                            print("Initial layout complete (circular_layout fallback).")
-                except Exception as e_layout:
-                    print(f"All layout algorithms failed: {e_layout}. Using manual layout.")
-                    # Final fallback: manual layout
-                    try:
-                        self.node_positions = self._generate_manual_layout()
-                        print("Using manually generated layout as last resort.")
-                    except Exception as e_manual:
-                        messagebox.showerror("Layout Error", 
-                            f"Failed to calculate any layout: {e_manual}\n\n"
-                            "This might be due to missing dependencies or an extremely large graph.")
-                        self.graph = None # Invalidate graph if layout fails
-                        return
-
-                # Draw the graph with the calculated positions
-                self.draw_graph()
-                self._save_history() # Save initial state AFTER layout
+                    # dot's hierarchical layout does not scale; sfdp (multilevel Barnes-Hut) does
+                    prog = 'sfdp' if graph.number_of_nodes() > LARGE_GRAPH_MIN_NODES else 'dot'
+                    positions = nx.nx_agraph.graphviz_layout(graph, prog=prog)
+                    print(f"Initial layout complete (using pygraphviz {prog}).")
+                    return positions
+                except Exception as e_gv:
+                    print(f"Initial pygraphviz failed: {e_gv}. Falling back to spring_layout.")
+            if SCIPY_INSTALLED:
+                # Second try: Use spring_layout (requires scipy)
+                positions = spring_layout(graph, seed=42)
+                print("Initial layout complete (spring_layout).")
             else:
-                print("Failed to build graph from tach data.")
-                # Clear any leftover plot
-                self.ax.clear()
-                self.ax.text(0.5, 0.5, "Failed to build graph", ha='center', va='center')
-                self.canvas.draw_idle()
-        else:
+                # Use circular layout if scipy not available
+                print("Using circular_layout (scipy not available)")
+                positions = nx.circular_layout(graph)
+                print("Initial layout complete (circular_layout fallback).")
+            return positions
+        except Exception as e_layout:
+            print(f"All layout algorithms failed: {e_layout}. Using manual layout.")
+            # Final fallback: manual layout (errors here are reported by _on_load_done)
+            positions = self._generate_manual_layout(graph)
+            print("Using manually generated layout as last resort.")
+            return positions
+
+    def _on_load_done(self, future):
+        """Shows the result of a background load (Tk thread)."""
+        try:
+            tach_data, graph, positions = future.result()
+        except LoadError as e:
+            messagebox.showerror(e.title, str(e))
+            self._show_load_failure("Failed to load dependencies")
+            return
+        except Exception as e:
+            messagebox.showerror("Error", f"An unexpected error occurred: {e}")
+            self._show_load_failure("Failed to load dependencies")
+            return
+
+        if not tach_data:
             print("Failed to get tach data.")
-            # Clear any leftover plot
-            self.ax.clear()
-            self.ax.text(0.5, 0.5, "Failed to load data from tach", ha='center', va='center')
-            self.canvas.draw_idle()
-            
-    def _generate_manual_layout(self):
+            self._show_load_failure("Failed to load data from tach")
+            return
+        self.tach_data = tach_data # Assign the data to the instance variable
+        self._file_node_keys = {}
+        if not graph:
+            print("Failed to build graph from tach data.")
+            self._show_load_failure("Failed to build graph")
+            return
+
+        self.graph = graph
+        self.node_positions = positions
+        self._rebuild_index_caches()
+        # Draw the graph with the calculated positions
+        self.draw_graph()
+        # The freshly loaded graph is the undo floor; history only holds deltas
+
+    def _show_load_failure(self, message):
+        """Replaces the plot with a failure message."""
+        # Clear any leftover plot, including the highlight overlay drawn on top of it
+        self._update_highlight_artists(None)
+        self.ax.clear()
+        self.ax.text(0.5, 0.5, message, ha='center', va='center')
+        self.canvas.draw_idle()
+
+    def _run_in_background(self, work, on_done):
+        """Runs work() on a daemon worker thread and then on_done(future) on the Tk thread.
+
+        Tk is not thread-safe, so the worker never touches widgets: the Tk thread
+        polls the future with after(). Graph-modifying actions are ignored while
+        a job is running (see _busy).
+        """
+        self._set_busy(True)
+        future = concurrent.futures.Future()
+
+        def run():
+            future.set_running_or_notify_cancel()
+            try:
+                result = work()
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+        # A daemon thread rather than an executor worker: those are joined at interpreter
+        # exit, so closing the window mid-job would keep the process alive until it ends
+        threading.Thread(target=run, name="depviz", daemon=True).start()
+
+        def poll():
+            if not future.done():
+                self._background_poll_id = self.after(BACKGROUND_POLL_MS, poll)
+                return
+            self._background_poll_id = None
+            self._set_busy(False)
+            on_done(future)
+
+        self._background_poll_id = self.after(BACKGROUND_POLL_MS, poll)
+
+    def _set_busy(self, busy):
+        """Marks a background job as running and updates the buttons accordingly."""
+        self._busy = busy
+        if busy:
+            self.select_button.configure(state="disabled")
+            self.load_button.configure(state="disabled")
+            self.undo_button.configure(state="disabled")
+            self.progress_bar.grid()
+            self.progress_bar.start()
+        else:
+            self.progress_bar.stop()
+            self.progress_bar.grid_remove()
+            self.select_button.configure(state="normal")
+            self.load_button.configure(state="normal" if self.project_root else "disabled")
+            self.undo_button.configure(state="normal" if self.history else "disabled")
+
+    @staticmethod
+    def _layout_span(positions):
+        """Returns the larger side of the bounding box of a layout (1.0 for degenerate layouts)."""
+        if not positions or len(positions) < 2:
+            return 1.0
+        xy = np.asarray(list(positions.values()), dtype=float)
+        span = float(np.ptp(xy, axis=0).max())
+        return span if span > 0 else 1.0
+
+    def _generate_manual_layout(self, graph=None):
         """Generate a simple manual layout as a last resort when all algorithms fail."""
-        if not self.graph:
+        graph = self.graph if graph is None else graph
+        if not graph:
             return {}
             
         positions = {}
-        nodes = list(self.graph.nodes())
+        nodes = list(graph.nodes())
         
         # Generate a simple circular layout manually
         num_nodes = len(nodes)
@@ -1238,9 +2061,35 @@ Raw output:
 
     # --- Add on_hover Method --- 
     def on_hover(self, event):
-        """Handles mouse motion events to show tooltips over nodes."""
+        """Handles mouse motion events, processing at most one per HOVER_MIN_INTERVAL_MS.
+
+        Events arriving sooner are not dropped outright: the latest one is handled
+        when the interval ends, so the tooltip matches where the cursor came to rest.
+        """
+        elapsed_ms = (time.monotonic() - self._last_hover_time) * 1000.0
+        if elapsed_ms < HOVER_MIN_INTERVAL_MS:
+            self._pending_hover_event = event
+            if self._hover_after_id is None:
+                self._hover_after_id = self.after(
+                    max(1, int(HOVER_MIN_INTERVAL_MS - elapsed_ms)), self._flush_pending_hover
+                )
+            return
+        self._pending_hover_event = None # Superseded by this newer event
+        self._last_hover_time = time.monotonic()
+        self._show_hover_tooltip(event)
+
+    def _flush_pending_hover(self):
+        """Handles the last motion event held back by on_hover's rate limit."""
+        self._hover_after_id = None
+        event, self._pending_hover_event = self._pending_hover_event, None
+        if event is not None:
+            self._last_hover_time = time.monotonic()
+            self._show_hover_tooltip(event)
+
+    def _show_hover_tooltip(self, event):
+        """Shows or hides the node tooltip for a mouse motion event."""
         if event.inaxes == self.ax and self.node_positions:
-            node_under_cursor = self.find_node_at_pos(event.x, event.y)
+            node_under_cursor = self._hover_node_at(event.x, event.y)
 
             if node_under_cursor:
                 if node_under_cursor != self.hovered_node:
@@ -1270,8 +2119,13 @@ Raw output:
 
     # --- Rename Deflate Button Tooltip Handlers --- 
     def show_undo_tooltip(self, event=None):
-        """Shows the tooltip for the undo button."""
-        self.undo_tooltip_label.configure(text="Undo (CTRL+Z)")
+        """Shows the tooltip for the undo button once the pointer has rested on it briefly."""
+        if self._undo_tooltip_after_id is not None:
+            self.after_cancel(self._undo_tooltip_after_id)
+        self._undo_tooltip_after_id = self.after(UNDO_TOOLTIP_DELAY_MS, self._place_undo_tooltip)
+
+    def _place_undo_tooltip(self):
+        self._undo_tooltip_after_id = None
         button_x = self.undo_button.winfo_x()
         button_y = self.undo_button.winfo_y()
         button_height = self.undo_button.winfo_height()
@@ -1283,6 +2137,9 @@ Raw output:
 
     def hide_undo_tooltip(self, event=None):
         """Hides the tooltip for the undo button."""
+        if self._undo_tooltip_after_id is not None:
+            self.after_cancel(self._undo_tooltip_after_id)
+            self._undo_tooltip_after_id = None
         self.undo_tooltip_label.place_forget()
 
     # --- Add Helper Function for Filepath to Node Mapping ---
@@ -1298,84 +2155,96 @@ Raw output:
             The name of the node in the graph representing this filepath,
             or None if no corresponding node exists in the current graph state.
         """
-        print(f"_map_filepath_to_graph_node: Trying to map '{filepath}'")
         if not filepath or not graph:
             return None
 
-        # --- Robust Normalization and Dot Conversion ---
-        try:
-            # 1. Normalize separators to POSIX style first
-            normalized_path = Path(filepath).as_posix()
-
-            # 2. Handle __init__.py separately to get parent dir path
-            if normalized_path.endswith('/__init__.py'):
-                # Get parent dir, could be empty for root __init__.py
-                path_base = os.path.dirname(normalized_path)
-                # Convert slashes to dots, handle root case
-                potential_node = path_base.replace('/', '.') if path_base else '.'
-            else:
-                # For other files, remove .py extension if present
-                path_base = os.path.splitext(normalized_path)[0]
-                # Convert slashes to dots
-                potential_node = path_base.replace('/', '.')
-
-        except TypeError as e:
-             print(f"  ERROR: Could not process filepath '{filepath}' with Pathlib: {e}")
-             return None
+        # The graph-independent part (module name, external check) depends only on
+        # the file, so it is resolved once per load; only the node lookups below
+        # change as the graph is exploded and undone
+        resolved = self._file_node_keys.get(filepath)
+        if resolved is None:
+            resolved = self._resolve_filepath(filepath)
+            self._file_node_keys[filepath] = resolved
+        potential_node, is_external, at_root = resolved
+        if potential_node is None:
+            return None
 
-        # --- External Check (moved after potential_node derivation) ---
-        if not os.path.exists(os.path.join(self.tach_project_root, filepath)):
-            parts = potential_node.split('.') # Use dot-separated name now
-            if parts and parts[0]:
-                 external_node_candidate = f"ext:{parts[0]}"
-                 #print(f"  Potential Node (External Check on '{potential_node}'): {external_node_candidate}")
-                 if graph.has_node(external_node_candidate):
-                      #print(f"  FOUND (External): {external_node_candidate}")
-                      return external_node_candidate
-                 #print(f"  NOT FOUND (External): {external_node_candidate}")
-                 return None
-            else:
-                 #print(f"  Cannot determine external package from: {potential_node}")
-                 return None
+        # --- External Check ---
+        # For external files the resolved name is already the 'ext:<top>' candidate
+        if is_external:
+            return potential_node if graph.has_node(potential_node) else None
 
         # --- Internal Node Check ---
-        #print(f"  Potential Node (Internal): {potential_node}")
 
         # 2. Check if the exact potential node name exists in the graph
         if graph.has_node(potential_node):
-            #print(f"  FOUND (Exact Internal): {potential_node}")
             return potential_node
 
-        # 3. If exact match not found, try finding the parent package/directory node
-        parts = potential_node.split('.')
-        for i in range(len(parts) - 1, 0, -1):
-             parent_node_name = '.'.join(parts[:i])
-             # --- DEBUG START ---
-             #print(f"    Checking parent: {parent_node_name}") # Ensure this is uncommented
-             # --- DEBUG END ---
+        # 3. If exact match not found, try finding the parent package/directory node,
+        #    stripping one dotted segment at a time (longest parent first)
+        parent_node_name, sep, _ = potential_node.rpartition('.')
+        while sep:
              if graph.has_node(parent_node_name):
-                 # --- DEBUG START ---
-                 #print(f"    FOUND (Parent Match): {parent_node_name}") # Ensure this is uncommented
-                 # --- DEBUG END ---
                  return parent_node_name
+             parent_node_name, sep, _ = parent_node_name.rpartition('.')
 
         # 4. Check if it belongs to the root node (if '.' node exists)
-        # --- DEBUG START ---
-        print(f"    Checking for root node '.' mapping...") # Ensure this is uncommented
-        # --- DEBUG END ---
-        if graph.has_node('.'):
-            if '/' not in normalized_path and '\\\\' not in normalized_path:
-                   return '.'
+        if graph.has_node('.') and at_root:
+            return '.'
         return None
 
+    def _resolve_filepath(self, filepath):
+        """Returns (node name, is external, is directly in the root) for a tach file path.
+
+        The node name is the dotted module name for internal files and the
+        'ext:<top level package>' candidate for external ones; it is None if the
+        path cannot be processed.
+        """
+        # --- Normalization and Dot Conversion (plain string ops, no Path objects) ---
+        if not isinstance(filepath, str):
+            logger.error("Could not process filepath %r: not a string", filepath)
+            return None, False, False
+        # 1. Normalize separators to POSIX style first
+        normalized_path = filepath.replace(os.sep, '/') if os.sep != '/' else filepath
+
+        # 2. Handle __init__.py separately to get parent dir path
+        if normalized_path.endswith('/__init__.py'):
+            # Get parent dir, could be empty for root __init__.py
+            path_base = normalized_path[:-len('/__init__.py')]
+            # Convert slashes to dots, handle root case
+            potential_node = path_base.replace('/', '.') if path_base else '.'
+        else:
+            # For other files, remove .py extension if present
+            path_base = os.path.splitext(normalized_path)[0]
+            # Convert slashes to dots
+            potential_node = path_base.replace('/', '.')
+
+        # Files that do not exist under the project root are external dependencies,
+        # represented by the 'ext:<top level package>' node
+        is_external = not self._project_path_exists(normalized_path)
+        if is_external:
+            top_level = potential_node.partition('.')[0] # Only the first dotted segment is needed
+            potential_node = f"ext:{top_level}" if top_level else None
+        at_root = '/' not in normalized_path and '\\\\' not in normalized_path
+        return potential_node, is_external, at_root
+
     # --- Add the on_closing method ---
     def on_closing(self):
         """Handles the event when the window is closed by the user."""
         print("Window close requested. Cleaning up and exiting...")
         try:
-            # Ensure matplotlib figure is closed if exists
+            # Release the matplotlib figure's artists if it exists
             if hasattr(self, 'fig') and self.fig:
-                 plt.close(self.fig)
+                 self.fig.clear()
+            # Stop polling a running background job; its daemon thread ends with the process
+            if self._background_poll_id is not None:
+                 self.after_cancel(self._background_poll_id)
+                 self._background_poll_id = None
+            # Remove the in-process tach map output file
+            # (may already be gone or locked; that must not keep the window open)
+            if self._tach_map_output:
+                 with suppress(OSError):
+                      os.remove(self._tach_map_output)
             # Quit the Tkinter main loop
             self.quit()
             # Destroy the main window and widgets
@@ -1392,11 +2261,12 @@ Raw output:
 def run_gui():
     """Initializes and runs the main Tkinter application loop."""
     print("--- run_gui() started ---")
+    # Diagnostic output from the graph/render paths goes through logging and stays quiet by default
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(name)s: %(message)s")
     try:
-        # Ensure matplotlib is using the proper backend for tkinter
-        import matplotlib
-        matplotlib.use('TkAgg')  # Force TkAgg backend for better event handling
-        
+        # The TkAgg backend is already selected at import time, before any matplotlib
+        # submodule that depends on it is imported
+
         # Set appearance mode and color theme
         try:
             ctk.set_appearance_mode("System") # Default to system theme (light or dark)